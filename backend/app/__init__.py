@@ -24,6 +24,10 @@ def create_app(config_name='development'):
     # Load configuration
     app.config.from_object(config[config_name])
     
+    # Encode JSON responses with orjson when it is installed
+    from .utils.json_provider import OrjsonProvider
+    app.json = OrjsonProvider(app)
+    
     # Initialize database
     initialize_database(app)
     
@@ -67,11 +71,14 @@ def initialize_database(app):
     Args:
         app (Flask): Flask application instance
     """
-    from .database import init_database, create_tables, check_database_connection
+    from .database import init_database, create_tables, check_database_connection, close_request_db
     import logging
     
     logger = logging.getLogger(__name__)
     
+    # Release the request-scoped session at the end of every request
+    app.teardown_appcontext(close_request_db)
+    
     try:
         # Initialize database with app config
         database_uri = app.config.get('SQLALCHEMY_DATABASE_URI')
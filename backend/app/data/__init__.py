@@ -0,0 +1,58 @@
+"""
+Static seed data for the CampusConnect application.
+
+This package ships JSON fixtures used to seed a development database and
+to serve fallback data, each loaded on first use and shared by every caller.
+"""
+
+import functools
+import json
+from importlib.resources import files
+from typing import Any, Dict, List
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _load_json(name: str) -> Any:
+    """
+    Read and parse a JSON file bundled in this package.
+    
+    Args:
+        name (str): File name inside app/data
+    
+    Returns:
+        Any: Parsed JSON content
+    """
+    raw = files(__name__).joinpath(name).read_bytes()
+    return orjson.loads(raw) if orjson is not None else json.loads(raw)
+
+
+@functools.cache
+def load_sample_posts() -> List[Dict[str, Any]]:
+    """
+    Get the sample posts used to seed the database.
+    
+    The list is parsed on first use and the same object is returned
+    afterwards, so callers must not modify it.
+    
+    Returns:
+        List[Dict]: Posts with title, description, category and author_email
+    """
+    return _load_json('sample_posts.json')
+
+
+@functools.cache
+def load_mock_events() -> List[Dict[str, Any]]:
+    """
+    Get the mock events served when the database is unavailable.
+    
+    The list is parsed on first use and the same object is returned
+    afterwards, so callers must not modify it.
+    
+    Returns:
+        List[Dict]: Events in the API response shape
+    """
+    return _load_json('mock_events.json')
@@ -5,7 +5,7 @@ This module handles SQLAlchemy database setup, connection management,
 and provides utilities for database operations.
 """
 
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, inspect, text
 from sqlalchemy.orm import sessionmaker, Session
 from sqlalchemy.exc import SQLAlchemyError
 from contextlib import contextmanager
@@ -81,6 +81,7 @@ def create_tables() -> None:
         
         # Create all tables
         Base.metadata.create_all(bind=engine)
+        upgrade_schema()
         logger.info("Database tables created successfully")
         
     except Exception as e:
@@ -88,6 +89,50 @@ def create_tables() -> None:
         raise
 
 
+def upgrade_schema() -> None:
+    """
+    Bring tables created by an older schema up to date.
+    
+    create_all() only creates missing tables, so columns and indexes added
+    to existing models are applied here. Each step checks first and is safe
+    to run on every startup.
+    """
+    global engine
+    
+    if engine is None:
+        raise RuntimeError("Database not initialized. Call init_database() first.")
+    
+    post_columns = {column['name'] for column in inspect(engine).get_columns('posts')}
+    if 'like_count' not in post_columns:
+        # Posts used to count likes from post_likes on every read
+        with engine.begin() as connection:
+            connection.execute(text(
+                "ALTER TABLE posts ADD COLUMN like_count INTEGER NOT NULL DEFAULT 0"
+            ))
+            connection.execute(text(
+                "UPDATE posts SET like_count = "
+                "(SELECT COUNT(*) FROM post_likes WHERE post_likes.post_id = posts.id)"
+            ))
+        logger.info("Added posts.like_count and backfilled it from post_likes")
+    
+    if engine.dialect.name == 'sqlite':
+        # Rows written by the old func.now() default hold whole seconds
+        # ('YYYY-MM-DD HH:MM:SS') while bound datetimes carry microseconds.
+        # SQLite compares them as strings, so a keyset cursor would return
+        # its own boundary row again; pad old values to the bound format
+        with engine.begin() as connection:
+            for table in ('posts', 'comments'):
+                connection.execute(text(
+                    f"UPDATE {table} SET created_at = created_at || '.000000' "
+                    "WHERE created_at NOT LIKE '%.%'"
+                ))
+    
+    # Indexes declared on tables that already existed
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(bind=engine, checkfirst=True)
+
+
 def drop_tables() -> None:
     """
     Drop all database tables. Use with caution!
@@ -150,6 +195,79 @@ def get_db() -> Generator[Session, None, None]:
         db.close()
 
 
+def get_request_db() -> Session:
+    """
+    Get the database session scoped to the current Flask request.
+    
+    The session is created on first use and stored on ``flask.g`` so every
+    service call made while handling the request shares one connection and
+    one transaction. It is committed and closed by close_request_db().
+    
+    Returns:
+        Session: SQLAlchemy database session for the current request
+    """
+    from flask import g
+    
+    if 'db_session' not in g:
+        g.db_session = get_db_session()
+    return g.db_session
+
+
+@contextmanager
+def request_savepoint() -> Generator[Session, None, None]:
+    """
+    Context manager running a block inside a SAVEPOINT on the request session.
+    
+    Fetching the session happens inside the block, so a caller that guards
+    the ``with`` statement also catches the RuntimeError raised when the
+    database has not been initialized. If the block raises, only the work it
+    did is rolled back; changes made earlier in the request are kept. A block
+    that commits the session itself ends the savepoint along with it.
+    
+    Yields:
+        Session: SQLAlchemy database session for the current request
+    """
+    db = get_request_db()
+    savepoint = db.begin_nested()
+    try:
+        yield db
+    except Exception:
+        if savepoint.is_active:
+            savepoint.rollback()
+        raise
+    else:
+        if savepoint.is_active:
+            savepoint.commit()
+
+
+def close_request_db(exception: BaseException = None) -> None:
+    """
+    Commit or roll back and close the request-scoped session, if any.
+    
+    Registered as an app-context teardown handler in create_app().
+    
+    Args:
+        exception (BaseException, optional): Unhandled exception raised while
+            handling the request, if any
+    """
+    from flask import g
+    
+    db = g.pop('db_session', None)
+    if db is None:
+        return
+    
+    try:
+        if exception is None:
+            db.commit()
+        else:
+            db.rollback()
+    except Exception as e:
+        db.rollback()
+        logger.error(f"Database transaction failed: {str(e)}")
+    finally:
+        db.close()
+
+
 def check_database_connection() -> bool:
     """
     Check if the database connection is working.
@@ -352,6 +352,10 @@ def create_sample_relationships(users, events, groups, posts):
             fresh_users[1].liked_posts.extend([fresh_posts[0], fresh_posts[4]])  # Jane likes John's and Alex's posts
             fresh_users[2].liked_posts.extend([fresh_posts[0], fresh_posts[3]])  # Mike likes John's and Jane's posts
             fresh_users[3].liked_posts.append(fresh_posts[1])  # Sarah likes Mike's post
+            
+            # Keep the denormalized like counters in step with post_likes
+            for post in fresh_posts:
+                post.like_count = len(post.liked_by_users)
         
         db.commit()
     
@@ -5,7 +5,7 @@ This module defines SQLAlchemy models for user authentication, profiles,
 and related functionality.
 """
 
-from sqlalchemy import Column, Integer, String, Text, Boolean, DateTime, ForeignKey, Table
+from sqlalchemy import Column, Integer, String, Text, Boolean, DateTime, ForeignKey, Table, Index, text
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
@@ -15,6 +15,12 @@ from datetime import datetime, timedelta
 
 Base = declarative_base()
 
+# Restrict an index to live rows so soft-deleted posts and comments never enter it
+ACTIVE_ROWS_ONLY = {
+    'postgresql_where': text('is_active'),
+    'sqlite_where': text('is_active = 1'),
+}
+
 # Association tables for many-to-many relationships
 user_events = Table(
     'user_events',
@@ -316,6 +322,12 @@ class Post(Base):
     """Post model for campus feed."""
     
     __tablename__ = 'posts'
+    __table_args__ = (
+        # Cover the active-feed filters ordered by newest first
+        Index('ix_post_active_created', 'created_at', 'id', **ACTIVE_ROWS_ONLY),
+        Index('ix_post_category_active_created', 'category', 'created_at', 'id', **ACTIVE_ROWS_ONLY),
+        Index('ix_post_author_active_created', 'author_id', 'created_at', 'id', **ACTIVE_ROWS_ONLY),
+    )
     
     id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
     title = Column(String(200), nullable=False)
@@ -325,11 +337,15 @@ class Post(Base):
     # Author
     author_id = Column(String(36), ForeignKey('users.id'), nullable=False)
     
+    # Denormalized like counter, kept in step with post_likes by PostService
+    like_count = Column(Integer, default=0, server_default='0', nullable=False)
+    
     # Status
     is_active = Column(Boolean, default=True, nullable=False)
     
-    # Timestamps
-    created_at = Column(DateTime, default=func.now(), nullable=False)
+    # Timestamps; created_at is set in Python so it keeps microseconds and
+    # is stored in the same format as the keyset cursors compared against it
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
     updated_at = Column(DateTime, default=func.now(), onupdate=func.now(), nullable=False)
     
     # Relationships
@@ -337,11 +353,6 @@ class Post(Base):
     comments = relationship("Comment", back_populates="post", cascade="all, delete-orphan")
     liked_by_users = relationship("User", secondary=post_likes, back_populates="liked_posts")
     
-    @property
-    def like_count(self) -> int:
-        """Get current like count."""
-        return len(self.liked_by_users)
-    
     @property
     def comment_count(self) -> int:
         """Get current comment count."""
@@ -371,6 +382,10 @@ class Comment(Base):
     """Comment model for post comments."""
     
     __tablename__ = 'comments'
+    __table_args__ = (
+        # Cover get_post_comments ordered by oldest first
+        Index('ix_comment_post_active_created', 'post_id', 'created_at', 'id', **ACTIVE_ROWS_ONLY),
+    )
     
     id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
     content = Column(Text, nullable=False)
@@ -382,8 +397,8 @@ class Comment(Base):
     # Status
     is_active = Column(Boolean, default=True, nullable=False)
     
-    # Timestamps
-    created_at = Column(DateTime, default=func.now(), nullable=False)
+    # Timestamps; set in Python for microsecond precision like Post.created_at
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
     updated_at = Column(DateTime, default=func.now(), onupdate=func.now(), nullable=False)
     
     # Relationships
@@ -80,6 +80,8 @@ class Group(BaseModel):
 
     class Config:
         populate_by_name = True
+        # Instances are cached and shared by GroupService, so they must not change
+        frozen = True
 
 
 # Request/Response Schemas
@@ -156,6 +158,7 @@ class ApiResponse(BaseModel):
     success: bool
     message: str = Field(..., min_length=1, max_length=500)
     data: Optional[dict] = Field(None, description="Optional response data")
+    details: Optional[dict] = Field(None, description="Optional error details")
 
 
 class ApiErrorResponse(BaseModel):
@@ -129,12 +129,10 @@ def send_otp():
     """
     try:
         # Validate request format
-        validation_error = handle_request_validation(request, required_json=True)
+        validation_error, request_data = handle_request_validation(request, required_json=True)
         if validation_error:
             return validation_error
         
-        request_data = request.get_json()
-        
         # Validate request data
         try:
             otp_request = SendOTPRequest(**request_data)
@@ -176,12 +174,10 @@ def verify_otp():
     """
     try:
         # Validate request format
-        validation_error = handle_request_validation(request, required_json=True)
+        validation_error, request_data = handle_request_validation(request, required_json=True)
         if validation_error:
             return validation_error
         
-        request_data = request.get_json()
-        
         # Validate request data
         try:
             verify_request = VerifyOTPRequest(**request_data)
@@ -221,12 +217,10 @@ def login():
     """
     try:
         # Validate request format
-        validation_error = handle_request_validation(request, required_json=True)
+        validation_error, request_data = handle_request_validation(request, required_json=True)
         if validation_error:
             return validation_error
         
-        request_data = request.get_json()
-        
         # Validate request data
         try:
             login_request = LoginRequest(**request_data)
@@ -267,12 +261,10 @@ def login_with_password():
     """
     try:
         # Validate request format
-        validation_error = handle_request_validation(request, required_json=True)
+        validation_error, request_data = handle_request_validation(request, required_json=True)
         if validation_error:
             return validation_error
         
-        request_data = request.get_json()
-        
         # Validate request data
         try:
             login_request = PasswordLoginRequest(**request_data)
@@ -313,12 +305,10 @@ def logout():
     """
     try:
         # Validate request format
-        validation_error = handle_request_validation(request, required_json=True)
+        validation_error, request_data = handle_request_validation(request, required_json=True)
         if validation_error:
             return validation_error
         
-        request_data = request.get_json()
-        
         # Validate request data
         try:
             logout_request = LogoutRequest(**request_data)
@@ -392,12 +382,10 @@ def reset_password():
     """
     try:
         # Validate request format
-        validation_error = handle_request_validation(request, required_json=True)
+        validation_error, request_data = handle_request_validation(request, required_json=True)
         if validation_error:
             return validation_error
         
-        request_data = request.get_json()
-        
         # Validate request data
         try:
             reset_request = ResetPasswordRequest(**request_data)
@@ -484,12 +472,10 @@ def signup():
     """
     try:
         # Validate request format
-        validation_error = handle_request_validation(request, required_json=True)
+        validation_error, request_data = handle_request_validation(request, required_json=True)
         if validation_error:
             return validation_error
         
-        request_data = request.get_json()
-        
         # Validate request data
         try:
             signup_request = SignupRequest(**request_data)
@@ -599,12 +585,10 @@ def verify_signup():
     """
     try:
         # Validate request format
-        validation_error = handle_request_validation(request, required_json=True)
+        validation_error, request_data = handle_request_validation(request, required_json=True)
         if validation_error:
             return validation_error
         
-        request_data = request.get_json()
-        
         # Validate request data
         try:
             verify_request = VerifyOTPRequest(**request_data)
@@ -657,12 +641,10 @@ def update_profile():
             return create_bad_request_response(session_result['message'])
         
         # Validate request format
-        validation_error = handle_request_validation(request, required_json=True)
+        validation_error, request_data = handle_request_validation(request, required_json=True)
         if validation_error:
             return validation_error
         
-        request_data = request.get_json()
-        
         # Validate request data
         try:
             profile_request = UpdateProfileRequest(**request_data)
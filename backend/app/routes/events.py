@@ -160,12 +160,10 @@ def join_event(event_id):
     """
     try:
         # Validate request format
-        validation_error = handle_request_validation(request, required_json=True)
+        validation_error, request_data = handle_request_validation(request, required_json=True)
         if validation_error:
             return validation_error
         
-        request_data = request.get_json()
-        
         # Validate request data using Pydantic model
         try:
             join_request = JoinEventRequest(**request_data)
@@ -35,10 +35,14 @@ def get_groups():
     try:
         # Get query parameters for filtering
         category = request.args.get('category')
+        tags = [tag.strip() for tag in request.args.get('tags', '').split(',') if tag.strip()]
         
         if category:
             groups = GroupService.get_groups_by_category(category)
             message = f"Groups for category '{category}' retrieved successfully"
+        elif tags:
+            groups = GroupService.get_groups_by_tags(tags)
+            message = f"Groups tagged '{', '.join(tags)}' retrieved successfully"
         else:
             groups = GroupService.get_all_groups()
             message = "Groups retrieved successfully"
@@ -163,12 +167,10 @@ def join_group(group_id):
     """
     try:
         # Validate request format
-        validation_error = handle_request_validation(request, required_json=True)
+        validation_error, request_data = handle_request_validation(request, required_json=True)
         if validation_error:
             return validation_error
         
-        request_data = request.get_json()
-        
         # Validate request data using Pydantic model
         try:
             join_request = JoinGroupRequest(**request_data)
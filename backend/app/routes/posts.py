@@ -17,7 +17,11 @@ from app.utils.helpers import (
     create_bad_request_response,
     handle_request_validation,
     format_list_response,
-    format_single_item_response
+    format_single_item_response,
+    render_list_body,
+    create_json_body_response,
+    encode_cursor,
+    parse_pagination_args
 )
 
 # Create posts blueprint
@@ -27,7 +31,10 @@ posts_bp = Blueprint('posts', __name__)
 @posts_bp.route('/posts', methods=['GET'])
 def get_posts():
     """
-    Get all posts.
+    Get a page of posts.
+    
+    Query parameters ``limit`` and ``cursor`` select the page; the cursor for
+    the next page is returned in ``pagination.next_cursor``.
     
     Returns:
         JSON response with list of posts or error message
@@ -37,17 +44,36 @@ def get_posts():
         category = request.args.get('category')
         author = request.args.get('author')
         
+        try:
+            limit, cursor = parse_pagination_args(request.args)
+        except ValueError as ve:
+            return create_bad_request_response(str(ve))
+        
         if category:
-            posts = PostService.get_posts_by_category(category)
+            posts, next_cursor = PostService.get_posts_by_category(category, limit, cursor)
             message = f"Posts for category '{category}' retrieved successfully"
         elif author:
-            posts = PostService.get_posts_by_author(author)
+            posts, next_cursor = PostService.get_posts_by_author(author, limit, cursor)
             message = f"Posts by author '{author}' retrieved successfully"
         else:
-            posts = PostService.get_all_posts()
-            message = "Posts retrieved successfully"
-        
-        return format_list_response(posts, message=message, resource_name="posts")
+            # The unfiltered feed is served from cached, already encoded bytes
+            body = PostService.get_all_posts_body(
+                limit,
+                cursor,
+                lambda posts, next_cursor: render_list_body(
+                    posts,
+                    "Posts retrieved successfully",
+                    pagination={"limit": limit, "next_cursor": encode_cursor(next_cursor)}
+                )
+            )
+            return create_json_body_response(body)
+        
+        return format_list_response(
+            posts,
+            message=message,
+            resource_name="posts",
+            pagination={"limit": limit, "next_cursor": encode_cursor(next_cursor)}
+        )
         
     except Exception as e:
         return create_internal_error_response(str(e))
@@ -163,12 +189,10 @@ def update_post(post_id):
         user_id = request.headers.get('X-User-ID', 'user-1')  # Temporary
         
         # Validate request format
-        validation_error = handle_request_validation(request, required_json=True)
+        validation_error, request_data = handle_request_validation(request, required_json=True)
         if validation_error:
             return validation_error
         
-        request_data = request.get_json()
-        
         # Validate request data using Pydantic model
         try:
             update_request = CreatePostRequest(**request_data)
@@ -280,8 +304,17 @@ def get_post_comments(post_id):
         JSON response with comments or error message
     """
     try:
-        comments = PostService.get_post_comments(post_id)
-        return format_list_response(comments, resource_name="comments")
+        try:
+            limit, cursor = parse_pagination_args(request.args)
+        except ValueError as ve:
+            return create_bad_request_response(str(ve))
+        
+        comments, next_cursor = PostService.get_post_comments(post_id, limit, cursor)
+        return format_list_response(
+            comments,
+            resource_name="comments",
+            pagination={"limit": limit, "next_cursor": encode_cursor(next_cursor)}
+        )
         
     except Exception as e:
         return create_internal_error_response(str(e))
@@ -303,11 +336,9 @@ def add_post_comment(post_id):
         user_id = request.headers.get('X-User-ID', 'user-1')  # Temporary
         
         # Validate request format
-        validation_error = handle_request_validation(request, required_json=True)
+        validation_error, request_data = handle_request_validation(request, required_json=True)
         if validation_error:
             return validation_error
-        
-        request_data = request.get_json()
         comment_content = request_data.get('comment', '').strip()
         
         if not comment_content:
@@ -325,6 +356,57 @@ def add_post_comment(post_id):
         return create_internal_error_response(str(e))
 
 
+# Largest number of comments accepted by one batch request
+MAX_COMMENT_BATCH = 100
+
+
+@posts_bp.route('/posts/comments/batch', methods=['POST'])
+def add_post_comments_batch():
+    """
+    Add several comments, possibly across posts, in one transaction.
+    
+    Expects a JSON body of the form
+    {"comments": [{"post_id": "...", "comment": "..."}, ...]}.
+    
+    Returns:
+        JSON response with created comment IDs or error message
+    """
+    try:
+        # TODO: Add authentication check to get user_id
+        user_id = request.headers.get('X-User-ID', 'user-1')  # Temporary
+        
+        # Validate request format
+        validation_error, request_data = handle_request_validation(request, required_json=True)
+        if validation_error:
+            return validation_error
+        
+        items = request_data.get('comments')
+        if not isinstance(items, list) or not items:
+            return create_bad_request_response("A non-empty 'comments' list is required")
+        
+        if len(items) > MAX_COMMENT_BATCH:
+            return create_bad_request_response(f"At most {MAX_COMMENT_BATCH} comments can be added at once")
+        
+        if not all(isinstance(item, dict) for item in items):
+            return create_bad_request_response("Each comment must be an object")
+        
+        entries = [
+            (str(item.get('post_id', '')), user_id, str(item.get('comment', '')))
+            for item in items
+        ]
+        
+        # Process bulk add comment request
+        result = PostService.add_comments_bulk(entries)
+        
+        if result.success:
+            return create_success_response(result.message, result.data, 201)
+        else:
+            return create_bad_request_response(result.message, result.details)
+        
+    except Exception as e:
+        return create_internal_error_response(str(e))
+
+
 @posts_bp.errorhandler(404)
 def post_not_found(error):
     """Handle 404 errors for post routes."""
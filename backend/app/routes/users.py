@@ -15,7 +15,9 @@ from app.utils.helpers import (
     create_bad_request_response,
     handle_request_validation,
     format_list_response,
-    format_single_item_response
+    format_single_item_response,
+    encode_cursor,
+    parse_pagination_args
 )
 
 # Create users blueprint
@@ -74,8 +76,18 @@ def get_user_posts(user_id):
     """
     try:
         from app.services.post_service import PostService
-        posts = PostService.get_posts_by_author(user_id)
-        return format_list_response(posts, resource_name="posts")
+        
+        try:
+            limit, cursor = parse_pagination_args(request.args)
+        except ValueError as ve:
+            return create_bad_request_response(str(ve))
+        
+        posts, next_cursor = PostService.get_posts_by_author(user_id, limit, cursor)
+        return format_list_response(
+            posts,
+            resource_name="posts",
+            pagination={"limit": limit, "next_cursor": encode_cursor(next_cursor)}
+        )
         
     except Exception as e:
         return create_internal_error_response(str(e))
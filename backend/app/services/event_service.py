@@ -5,17 +5,59 @@ This module provides services for event management including
 retrieving events, joining events, saving events, and managing event data.
 """
 
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 from datetime import datetime
+import functools
 import logging
 
-from app.database import get_db
+from sqlalchemy import select, exists
+
+from app.database import request_savepoint
 from app.models.auth_models import Event, User, user_events, user_saved_events
 from app.models.data_models import JoinEventRequest, ApiResponse
+from app.data import load_mock_events
 
 logger = logging.getLogger(__name__)
 
 
+def _index_by_category(events: List[Dict[str, Any]]) -> Dict[str, Tuple[Dict[str, Any], ...]]:
+    """
+    Group event dictionaries by their category.
+    
+    Args:
+        events (list): Event dictionaries to group
+        
+    Returns:
+        Dict mapping each category to a tuple of its events
+    """
+    buckets: Dict[str, List[Dict[str, Any]]] = {}
+    for event in events:
+        buckets.setdefault(event["category"], []).append(event)
+    return {category: tuple(bucket) for category, bucket in buckets.items()}
+
+
+@functools.cache
+def _mock_events_by_category() -> Dict[str, Tuple[Dict[str, Any], ...]]:
+    """
+    Get the fallback mock events bucketed by category, built on first use.
+    
+    Returns:
+        Dict mapping each category to a tuple of its mock events
+    """
+    return _index_by_category(load_mock_events())
+
+
+@functools.cache
+def _mock_events_by_id() -> Dict[str, Dict[str, Any]]:
+    """
+    Get the fallback mock events keyed by ID, built on first use.
+    
+    Returns:
+        Dict mapping each event ID to its mock event
+    """
+    return {event["id"]: event for event in load_mock_events()}
+
+
 class EventService:
     """Service class for event operations."""
     
@@ -28,7 +70,7 @@ class EventService:
             List of event dictionaries
         """
         try:
-            with get_db() as db:
+            with request_savepoint() as db:
                 events = db.query(Event).filter(Event.is_active == True).all()
                 return [event.to_dict() for event in events]
         except Exception as e:
@@ -48,7 +90,7 @@ class EventService:
             Event dictionary if found, None otherwise
         """
         try:
-            with get_db() as db:
+            with request_savepoint() as db:
                 event = db.query(Event).filter(
                     Event.id == event_id,
                     Event.is_active == True
@@ -60,8 +102,7 @@ class EventService:
         except Exception as e:
             logger.error(f"Error retrieving event {event_id}: {str(e)}")
             # Return mock data as fallback
-            mock_events = cls._get_mock_events()
-            return next((event for event in mock_events if event["id"] == event_id), None)
+            return _mock_events_by_id().get(event_id)
     
     @classmethod
     def join_event(cls, event_id: str, user_id: str) -> Dict[str, Any]:
@@ -76,7 +117,7 @@ class EventService:
             Dictionary containing the result of the join operation
         """
         try:
-            with get_db() as db:
+            with request_savepoint() as db:
                 # Find the event
                 event = db.query(Event).filter(
                     Event.id == event_id,
@@ -146,7 +187,7 @@ class EventService:
             Dictionary containing the result of the leave operation
         """
         try:
-            with get_db() as db:
+            with request_savepoint() as db:
                 # Find the event
                 event = db.query(Event).filter(
                     Event.id == event_id,
@@ -209,7 +250,7 @@ class EventService:
             Dictionary containing the result of the save operation
         """
         try:
-            with get_db() as db:
+            with request_savepoint() as db:
                 # Find the event
                 event = db.query(Event).filter(
                     Event.id == event_id,
@@ -271,7 +312,7 @@ class EventService:
             Dictionary containing the result of the unsave operation
         """
         try:
-            with get_db() as db:
+            with request_savepoint() as db:
                 # Find the event
                 event = db.query(Event).filter(
                     Event.id == event_id,
@@ -332,7 +373,7 @@ class EventService:
             Dictionary containing joined and saved events
         """
         try:
-            with get_db() as db:
+            with request_savepoint() as db:
                 user = db.query(User).filter(User.id == user_id).first()
                 if not user:
                     return {
@@ -371,33 +412,40 @@ class EventService:
             Dictionary containing user's relationship to the event
         """
         try:
-            with get_db() as db:
-                event = db.query(Event).filter(
-                    Event.id == event_id,
-                    Event.is_active == True
-                ).first()
+            with request_savepoint() as db:
+                # Resolve event, user and both memberships in a single round trip
+                event_exists, user_exists, is_joined, is_saved = db.execute(
+                    select(
+                        exists().where(Event.id == event_id, Event.is_active == True),
+                        exists().where(User.id == user_id),
+                        exists().where(
+                            user_events.c.user_id == user_id,
+                            user_events.c.event_id == event_id
+                        ),
+                        exists().where(
+                            user_saved_events.c.user_id == user_id,
+                            user_saved_events.c.event_id == event_id
+                        )
+                    )
+                ).one()
                 
-                if not event:
+                if not event_exists:
                     return {
                         "success": False,
                         "message": "Event not found"
                     }
                 
-                user = db.query(User).filter(User.id == user_id).first()
-                if not user:
+                if not user_exists:
                     return {
                         "success": False,
                         "message": "User not found"
                     }
                 
-                is_joined = user in event.attendees
-                is_saved = event in user.saved_events
-                
                 return {
                     "success": True,
                     "data": {
-                        "is_joined": is_joined,
-                        "is_saved": is_saved,
+                        "is_joined": bool(is_joined),
+                        "is_saved": bool(is_saved),
                         "event_id": event_id
                     }
                 }
@@ -417,78 +465,7 @@ class EventService:
         Returns:
             List of mock event dictionaries
         """
-        return [
-            {
-                "id": "1",
-                "title": "Tech Career Fair 2024",
-                "description": "Connect with top tech companies and explore career opportunities in software engineering, data science, and more.",
-                "date": "2024-03-15",
-                "time": "10:00 AM - 4:00 PM",
-                "location": "Student Union Building",
-                "category": "career",
-                "organizer": "Career Services",
-                "attendees": 45,
-                "max_attendees": 200,
-                "image": "https://images.unsplash.com/photo-1560472354-b33ff0c44a43?w=400",
-                "tags": ["career", "networking", "technology"]
-            },
-            {
-                "id": "2", 
-                "title": "Spring Music Festival",
-                "description": "Join us for an evening of live music featuring local bands and student performers.",
-                "date": "2024-03-20",
-                "time": "6:00 PM - 10:00 PM",
-                "location": "Campus Amphitheater",
-                "category": "arts",
-                "organizer": "Student Activities",
-                "attendees": 120,
-                "max_attendees": 300,
-                "image": "https://images.unsplash.com/photo-1493225457124-a3eb161ffa5f?w=400",
-                "tags": ["music", "entertainment", "community"]
-            },
-            {
-                "id": "3",
-                "title": "Study Abroad Information Session",
-                "description": "Learn about study abroad opportunities and application processes for various international programs.",
-                "date": "2024-03-18",
-                "time": "2:00 PM - 3:30 PM", 
-                "location": "International Center",
-                "category": "academic",
-                "organizer": "International Programs",
-                "attendees": 28,
-                "max_attendees": 50,
-                "image": "https://images.unsplash.com/photo-1488646953014-85cb44e25828?w=400",
-                "tags": ["education", "international", "travel"]
-            },
-            {
-                "id": "4",
-                "title": "Basketball Tournament Finals",
-                "description": "Cheer on our campus teams in the final championship games of the intramural basketball season.",
-                "date": "2024-03-22",
-                "time": "7:00 PM - 9:00 PM",
-                "location": "Recreation Center Gym",
-                "category": "sports",
-                "organizer": "Intramural Sports",
-                "attendees": 85,
-                "max_attendees": 150,
-                "image": "https://images.unsplash.com/photo-1546519638-68e109498ffc?w=400",
-                "tags": ["sports", "competition", "community"]
-            },
-            {
-                "id": "5",
-                "title": "Mental Health Awareness Workshop",
-                "description": "Interactive workshop focusing on stress management techniques and mental wellness resources.",
-                "date": "2024-03-25",
-                "time": "1:00 PM - 3:00 PM",
-                "location": "Wellness Center",
-                "category": "social",
-                "organizer": "Counseling Services",
-                "attendees": 32,
-                "max_attendees": 40,
-                "image": "https://images.unsplash.com/photo-1559757148-5c350d0d3c56?w=400",
-                "tags": ["wellness", "mental health", "workshop"]
-            }
-        ]  
+        return list(load_mock_events())
   
     @classmethod
     def get_events_by_category(cls, category: str) -> List[Dict[str, Any]]:
@@ -502,7 +479,7 @@ class EventService:
             List of events in the specified category
         """
         try:
-            with get_db() as db:
+            with request_savepoint() as db:
                 events = db.query(Event).filter(
                     Event.category == category,
                     Event.is_active == True
@@ -511,8 +488,7 @@ class EventService:
         except Exception as e:
             logger.error(f"Error retrieving events by category {category}: {str(e)}")
             # Return filtered mock data as fallback
-            mock_events = cls._get_mock_events()
-            return [event for event in mock_events if event["category"] == category]
+            return list(_mock_events_by_category().get(category, ()))
 
     @classmethod
     def create_event(cls, create_request, user_id: str) -> ApiResponse:
@@ -527,7 +503,7 @@ class EventService:
             ApiResponse: Success or error response with created event data
         """
         try:
-            with get_db() as db:
+            with request_savepoint() as db:
                 # Find the user
                 user = db.query(User).filter(User.id == user_id).first()
                 if not user:
@@ -6,112 +6,253 @@ business logic including retrieving groups, joining groups, and managing
 group data with mock data for development.
 """
 
-from typing import List, Optional
+import functools
+import itertools
+import threading
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Tuple
+from pydantic import TypeAdapter
 from app.models.data_models import Group, JoinGroupRequest, ApiResponse
 
+# Validates a whole list of groups in one pass instead of one Group(...) call per row
+_GROUP_LIST_ADAPTER = TypeAdapter(List[Group])
+
+
+@dataclass(frozen=True, slots=True)
+class _GroupRow:
+    """Immutable static fields of a mock group."""
+    id: str
+    name: str
+    description: str
+    category: str
+    image: str
+    meeting_time: str
+    location: str
+    contact: str
+    tags: Tuple[str, ...] = ()
+
+
+def _index_by_category(rows: Iterable[_GroupRow]) -> Dict[str, Tuple[_GroupRow, ...]]:
+    """
+    Build a category to groups index.
+    
+    Args:
+        rows (Iterable[_GroupRow]): Group rows to index
+        
+    Returns:
+        Dict[str, Tuple[_GroupRow, ...]]: Groups bucketed by category
+    """
+    index = defaultdict(list)
+    for row in rows:
+        index[row.category].append(row)
+    return {category: tuple(bucket) for category, bucket in index.items()}
+
+
+def _index_by_tag(rows: Iterable[_GroupRow]) -> Dict[str, FrozenSet[str]]:
+    """
+    Build a tag to group IDs inverted index.
+    
+    Args:
+        rows (Iterable[_GroupRow]): Group rows to index
+        
+    Returns:
+        Dict[str, FrozenSet[str]]: IDs of the groups carrying each tag
+    """
+    index = defaultdict(set)
+    for row in rows:
+        for tag in row.tags:
+            index[tag].add(row.id)
+    return {tag: frozenset(ids) for tag, ids in index.items()}
+
+
+def _model_input(row: _GroupRow, members: int) -> Dict[str, Any]:
+    """
+    Build the Group validation input for a row and its member count.
+    
+    Args:
+        row (_GroupRow): Static group fields
+        members (int): Current member count
+        
+    Returns:
+        Dict[str, Any]: Field values keyed by Group field name
+    """
+    return {
+        'id': row.id,
+        'name': row.name,
+        'description': row.description,
+        'category': row.category,
+        'members': members,
+        'image': row.image,
+        'meeting_time': row.meeting_time,
+        'location': row.location,
+        'contact': row.contact,
+        'tags': list(row.tags)
+    }
+
+
+def _to_model(row: _GroupRow, members: int) -> Group:
+    """
+    Build a validated Group model from a row and its member count.
+    
+    Args:
+        row (_GroupRow): Static group fields
+        members (int): Current member count
+        
+    Returns:
+        Group: Validated group model
+    """
+    return Group.model_validate(_model_input(row, members))
+
+
+def _build_models(rows: Iterable[_GroupRow], members: Dict[str, int]) -> Dict[str, Group]:
+    """
+    Build validated Group models keyed by group ID.
+    
+    Args:
+        rows (Iterable[_GroupRow]): Group rows to convert
+        members (Dict[str, int]): Member count per group ID
+        
+    Returns:
+        Dict[str, Group]: Group models by ID, in row order
+    """
+    models = _GROUP_LIST_ADAPTER.validate_python(
+        [_model_input(row, members[row.id]) for row in rows]
+    )
+    return {model.id: model for model in models}
+
 
 class GroupService:
     """Service class for handling group-related business logic."""
     
     # Mock groups data matching the frontend structure
-    _mock_groups = [
-        {
-            "id": "1",
-            "name": "Robotics Club",
-            "description": "Build, program, and compete with robots! We participate in national competitions and work on innovative projects. Perfect for engineering and computer science students.",
-            "category": "academic",
-            "members": 45,
-            "image": "https://images.pexels.com/photos/2599244/pexels-photo-2599244.jpeg?auto=compress&cs=tinysrgb&w=400",
-            "meetingTime": "Wednesdays 7:00 PM",
-            "location": "Engineering Lab 204",
-            "contact": "robotics@campus.edu",
-            "tags": ["STEM", "competition", "technology"]
-        },
-        {
-            "id": "2",
-            "name": "Drama Society",
-            "description": "Express yourself through theater! We produce 3 major shows per year and offer opportunities for acting, directing, set design, and technical theater.",
-            "category": "arts",
-            "members": 78,
-            "image": "https://images.pexels.com/photos/713149/pexels-photo-713149.jpeg?auto=compress&cs=tinysrgb&w=400",
-            "meetingTime": "Tuesdays & Thursdays 6:00 PM",
-            "location": "Theater Arts Building",
-            "contact": "drama@campus.edu",
-            "tags": ["theater", "performance", "creativity"]
-        },
-        {
-            "id": "3",
-            "name": "Environmental Action Group",
-            "description": "Making our campus and community more sustainable. We organize clean-up events, sustainability workshops, and advocate for environmental policies.",
-            "category": "service",
-            "members": 67,
-            "image": "https://images.pexels.com/photos/1108572/pexels-photo-1108572.jpeg?auto=compress&cs=tinysrgb&w=400",
-            "meetingTime": "Mondays 5:30 PM",
-            "location": "Student Union Room 240",
-            "contact": "green@campus.edu",
-            "tags": ["environment", "activism", "community"]
-        },
-        {
-            "id": "4",
-            "name": "Business Network Society",
-            "description": "Connect with future business leaders and industry professionals. We host networking events, guest speaker sessions, and career development workshops.",
-            "category": "professional",
-            "members": 123,
-            "image": "https://images.pexels.com/photos/1181676/pexels-photo-1181676.jpeg?auto=compress&cs=tinysrgb&w=400",
-            "meetingTime": "Fridays 4:00 PM",
-            "location": "Business School Auditorium",
-            "contact": "business@campus.edu",
-            "tags": ["networking", "career", "business"]
-        },
-        {
-            "id": "5",
-            "name": "Ultimate Frisbee Club",
-            "description": "Fast-paced, fun, and competitive ultimate frisbee. We practice regularly and compete in regional tournaments. All skill levels welcome!",
-            "category": "sports",
-            "members": 34,
-            "image": "https://images.pexels.com/photos/606539/pexels-photo-606539.jpeg?auto=compress&cs=tinysrgb&w=400",
-            "meetingTime": "Tuesdays & Saturdays 4:00 PM",
-            "location": "Campus Recreation Fields",
-            "contact": "frisbee@campus.edu",
-            "tags": ["sports", "fitness", "competition"]
-        },
-        {
-            "id": "6",
-            "name": "Cultural Exchange Club",
-            "description": "Celebrate diversity and learn about different cultures. We organize cultural events, language exchange programs, and international friendship activities.",
-            "category": "social",
-            "members": 89,
-            "image": "https://images.pexels.com/photos/1640777/pexels-photo-1640777.jpeg?auto=compress&cs=tinysrgb&w=400",
-            "meetingTime": "Thursdays 6:30 PM",
-            "location": "International House",
-            "contact": "cultural@campus.edu",
-            "tags": ["culture", "diversity", "international"]
-        },
-        {
-            "id": "7",
-            "name": "Photography Society",
-            "description": "Capture the world through your lens! Weekly photo walks, workshops on technique and editing, and annual photography exhibition.",
-            "category": "arts",
-            "members": 56,
-            "image": "https://images.pexels.com/photos/1264210/pexels-photo-1264210.jpeg?auto=compress&cs=tinysrgb&w=400",
-            "meetingTime": "Sundays 2:00 PM",
-            "location": "Art Building Studio 3",
-            "contact": "photo@campus.edu",
-            "tags": ["photography", "art", "creativity"]
-        },
-        {
-            "id": "8",
-            "name": "Volunteer Corps",
-            "description": "Make a difference in our community! We coordinate volunteer opportunities at local nonprofits, organize service projects, and promote civic engagement.",
-            "category": "service",
-            "members": 112,
-            "image": "https://images.pexels.com/photos/6646918/pexels-photo-6646918.jpeg?auto=compress&cs=tinysrgb&w=400",
-            "meetingTime": "Wednesdays 7:30 PM",
-            "location": "Community Service Center",
-            "contact": "volunteer@campus.edu",
-            "tags": ["service", "community", "volunteer"]
-        }
-    ]
+    _mock_groups: Tuple[_GroupRow, ...] = (
+        _GroupRow(
+            id="1",
+            name="Robotics Club",
+            description="Build, program, and compete with robots! We participate in national competitions and work on innovative projects. Perfect for engineering and computer science students.",
+            category="academic",
+            image="https://images.pexels.com/photos/2599244/pexels-photo-2599244.jpeg?auto=compress&cs=tinysrgb&w=400",
+            meeting_time="Wednesdays 7:00 PM",
+            location="Engineering Lab 204",
+            contact="robotics@campus.edu",
+            tags=("STEM", "competition", "technology")
+        ),
+        _GroupRow(
+            id="2",
+            name="Drama Society",
+            description="Express yourself through theater! We produce 3 major shows per year and offer opportunities for acting, directing, set design, and technical theater.",
+            category="arts",
+            image="https://images.pexels.com/photos/713149/pexels-photo-713149.jpeg?auto=compress&cs=tinysrgb&w=400",
+            meeting_time="Tuesdays & Thursdays 6:00 PM",
+            location="Theater Arts Building",
+            contact="drama@campus.edu",
+            tags=("theater", "performance", "creativity")
+        ),
+        _GroupRow(
+            id="3",
+            name="Environmental Action Group",
+            description="Making our campus and community more sustainable. We organize clean-up events, sustainability workshops, and advocate for environmental policies.",
+            category="service",
+            image="https://images.pexels.com/photos/1108572/pexels-photo-1108572.jpeg?auto=compress&cs=tinysrgb&w=400",
+            meeting_time="Mondays 5:30 PM",
+            location="Student Union Room 240",
+            contact="green@campus.edu",
+            tags=("environment", "activism", "community")
+        ),
+        _GroupRow(
+            id="4",
+            name="Business Network Society",
+            description="Connect with future business leaders and industry professionals. We host networking events, guest speaker sessions, and career development workshops.",
+            category="professional",
+            image="https://images.pexels.com/photos/1181676/pexels-photo-1181676.jpeg?auto=compress&cs=tinysrgb&w=400",
+            meeting_time="Fridays 4:00 PM",
+            location="Business School Auditorium",
+            contact="business@campus.edu",
+            tags=("networking", "career", "business")
+        ),
+        _GroupRow(
+            id="5",
+            name="Ultimate Frisbee Club",
+            description="Fast-paced, fun, and competitive ultimate frisbee. We practice regularly and compete in regional tournaments. All skill levels welcome!",
+            category="sports",
+            image="https://images.pexels.com/photos/606539/pexels-photo-606539.jpeg?auto=compress&cs=tinysrgb&w=400",
+            meeting_time="Tuesdays & Saturdays 4:00 PM",
+            location="Campus Recreation Fields",
+            contact="frisbee@campus.edu",
+            tags=("sports", "fitness", "competition")
+        ),
+        _GroupRow(
+            id="6",
+            name="Cultural Exchange Club",
+            description="Celebrate diversity and learn about different cultures. We organize cultural events, language exchange programs, and international friendship activities.",
+            category="social",
+            image="https://images.pexels.com/photos/1640777/pexels-photo-1640777.jpeg?auto=compress&cs=tinysrgb&w=400",
+            meeting_time="Thursdays 6:30 PM",
+            location="International House",
+            contact="cultural@campus.edu",
+            tags=("culture", "diversity", "international")
+        ),
+        _GroupRow(
+            id="7",
+            name="Photography Society",
+            description="Capture the world through your lens! Weekly photo walks, workshops on technique and editing, and annual photography exhibition.",
+            category="arts",
+            image="https://images.pexels.com/photos/1264210/pexels-photo-1264210.jpeg?auto=compress&cs=tinysrgb&w=400",
+            meeting_time="Sundays 2:00 PM",
+            location="Art Building Studio 3",
+            contact="photo@campus.edu",
+            tags=("photography", "art", "creativity")
+        ),
+        _GroupRow(
+            id="8",
+            name="Volunteer Corps",
+            description="Make a difference in our community! We coordinate volunteer opportunities at local nonprofits, organize service projects, and promote civic engagement.",
+            category="service",
+            image="https://images.pexels.com/photos/6646918/pexels-photo-6646918.jpeg?auto=compress&cs=tinysrgb&w=400",
+            meeting_time="Wednesdays 7:30 PM",
+            location="Community Service Center",
+            contact="volunteer@campus.edu",
+            tags=("service", "community", "volunteer")
+        )
+    )
+
+    # Current member count per group ID, the only mutable per-group field
+    _members: Dict[str, int] = {
+        "1": 45,
+        "2": 78,
+        "3": 67,
+        "4": 123,
+        "5": 34,
+        "6": 89,
+        "7": 56,
+        "8": 112
+    }
+
+    # Index of mock groups by ID, kept in sync with _mock_groups
+    _mock_groups_by_id: Dict[str, _GroupRow] = {row.id: row for row in _mock_groups}
+
+    # Index of mock groups by category, kept in sync with _mock_groups.
+    # This, _tag_index and _group_models_by_id are iterated by readers
+    # without the lock, so writers never mutate them in place: they build
+    # an updated copy and publish it with a single attribute assignment.
+    _mock_groups_by_category: Dict[str, Tuple[_GroupRow, ...]] = _index_by_category(_mock_groups)
+
+    # Inverted index of tag to group IDs, kept in sync with _mock_groups
+    _tag_index: Dict[str, FrozenSet[str]] = _index_by_tag(_mock_groups)
+
+    # Validated Group models by ID, rebuilt only when a group changes
+    _group_models_by_id: Dict[str, Group] = _build_models(_mock_groups, _members)
+
+    # Source of new group IDs; never reuses an ID even if groups are removed
+    _id_counter = itertools.count(len(_mock_groups) + 1)
+
+    # Bumped on every mutation so cached listings keyed by it go stale
+    _version = 0
+
+    # Serializes writers so the list, its indexes and member counts stay
+    # consistent; readers never take it
+    _lock = threading.RLock()
 
     @classmethod
     def get_all_groups(cls) -> List[Group]:
@@ -121,7 +262,21 @@ class GroupService:
         Returns:
             List[Group]: List of all groups with validation
         """
-        return [Group(**group_data) for group_data in cls._mock_groups]
+        return list(cls._get_all(cls._version))
+
+    @classmethod
+    @functools.lru_cache(maxsize=8)
+    def _get_all(cls, version: int) -> Tuple[Group, ...]:
+        """
+        Snapshot all group models for a given data version.
+        
+        Args:
+            version (int): Value of _version the snapshot belongs to
+            
+        Returns:
+            Tuple[Group, ...]: All groups at that version
+        """
+        return tuple(cls._group_models_by_id.values())
 
     @classmethod
     def get_group_by_id(cls, group_id: str) -> Optional[Group]:
@@ -134,8 +289,7 @@ class GroupService:
         Returns:
             Optional[Group]: The group if found, None otherwise
         """
-        group_data = next((group for group in cls._mock_groups if group['id'] == group_id), None)
-        return Group(**group_data) if group_data else None
+        return cls._group_models_by_id.get(group_id)
 
     @classmethod
     def join_group(cls, group_id: str, join_request: JoinGroupRequest) -> ApiResponse:
@@ -150,9 +304,9 @@ class GroupService:
             ApiResponse: Success or error response
         """
         # Find the group
-        group_data = next((group for group in cls._mock_groups if group['id'] == group_id), None)
+        row = cls._mock_groups_by_id.get(group_id)
         
-        if not group_data:
+        if not row:
             return ApiResponse(
                 success=False,
                 message=f"Group with ID {group_id} not found"
@@ -165,19 +319,27 @@ class GroupService:
         # 4. Update database
         
         # For mock implementation, just increment members count
-        group_data['members'] += 1
+        with cls._lock:
+            members = cls._members[group_id] + 1
+            cls._members[group_id] = members
+            # The row was validated when first loaded and only the count
+            # changes, so copy the model instead of re-validating it
+            models = dict(cls._group_models_by_id)
+            models[group_id] = models[group_id].model_copy(update={'members': members})
+            cls._group_models_by_id = models
+            cls._version += 1
         
         return ApiResponse(
             success=True,
-            message=f"Successfully joined '{group_data['name']}'. The group organizers will contact you at {join_request.user_email}.",
+            message=f"Successfully joined '{row.name}'. The group organizers will contact you at {join_request.user_email}.",
             data={
                 "group_id": group_id,
-                "group_name": group_data['name'],
+                "group_name": row.name,
                 "user_name": join_request.user_name,
                 "user_email": join_request.user_email,
                 "message": join_request.message,
-                "new_member_count": group_data['members'],
-                "contact": group_data['contact']
+                "new_member_count": members,
+                "contact": row.contact
             }
         )
 
@@ -192,8 +354,29 @@ class GroupService:
         Returns:
             List[Group]: List of groups in the specified category
         """
-        filtered_groups = [group for group in cls._mock_groups if group['category'] == category]
-        return [Group(**group_data) for group_data in filtered_groups]
+        models = cls._group_models_by_id
+        return [models[row.id] for row in cls._mock_groups_by_category.get(category, ())]
+
+    @classmethod
+    def get_groups_by_tags(cls, tags: List[str]) -> List[Group]:
+        """
+        Retrieve groups carrying every one of the given tags.
+        
+        Args:
+            tags (List[str]): Tags that must all be present
+            
+        Returns:
+            List[Group]: List of groups tagged with all of the tags
+        """
+        if not tags:
+            return []
+        
+        # Intersect starting from the rarest tag to keep the working set small
+        tag_index = cls._tag_index
+        id_sets = sorted((tag_index.get(tag, frozenset()) for tag in tags), key=len)
+        matching_ids = id_sets[0].intersection(*id_sets[1:])
+        models = cls._group_models_by_id
+        return [models[group_id] for group_id in sorted(matching_ids, key=int)]
 
     @classmethod
     def create_group(cls, create_request, user_id: str) -> ApiResponse:
@@ -208,28 +391,54 @@ class GroupService:
             ApiResponse: Success or error response with created group data
         """
         try:
-            # Generate a new ID for the group
-            new_id = str(len(cls._mock_groups) + 1)
-            
-            # Create new group data
-            new_group_data = {
-                "id": new_id,
-                "name": create_request.name,
-                "description": create_request.description,
-                "category": create_request.category,
-                "members": 1,  # Creator is the first member
-                "image": create_request.image or "https://images.pexels.com/photos/1181676/pexels-photo-1181676.jpeg?auto=compress&cs=tinysrgb&w=400",
-                "meetingTime": create_request.meeting_time,
-                "location": create_request.location,
-                "contact": create_request.contact,
-                "tags": []
-            }
-            
-            # Add to mock groups list
-            cls._mock_groups.append(new_group_data)
-            
-            # Create Group object for validation
-            new_group = Group(**new_group_data)
+            with cls._lock:
+                # Generate a new ID for the group
+                new_id = str(next(cls._id_counter))
+                
+                # Create new group data
+                new_group_data = {
+                    "id": new_id,
+                    "name": create_request.name,
+                    "description": create_request.description,
+                    "category": create_request.category,
+                    "members": 1,  # Creator is the first member
+                    "image": create_request.image or "https://images.pexels.com/photos/1181676/pexels-photo-1181676.jpeg?auto=compress&cs=tinysrgb&w=400",
+                    "meetingTime": create_request.meeting_time,
+                    "location": create_request.location,
+                    "contact": create_request.contact,
+                    "tags": []
+                }
+                
+                row = _GroupRow(
+                    id=new_id,
+                    name=create_request.name,
+                    description=create_request.description,
+                    category=create_request.category,
+                    image=new_group_data['image'],
+                    meeting_time=create_request.meeting_time,
+                    location=create_request.location,
+                    contact=create_request.contact
+                )
+                
+                # Validate before the group becomes visible to readers
+                new_group = _to_model(row, new_group_data['members'])
+                
+                # Publish the row and updated copies of the indexes,
+                # models first so every indexed ID already has a model
+                cls._mock_groups = cls._mock_groups + (row,)
+                cls._members[new_id] = new_group_data['members']
+                cls._mock_groups_by_id[new_id] = row
+                cls._group_models_by_id = {**cls._group_models_by_id, new_id: new_group}
+                cls._mock_groups_by_category = {
+                    **cls._mock_groups_by_category,
+                    row.category: cls._mock_groups_by_category.get(row.category, ()) + (row,)
+                }
+                if row.tags:
+                    cls._tag_index = {
+                        **cls._tag_index,
+                        **{tag: cls._tag_index.get(tag, frozenset()) | {new_id} for tag in row.tags}
+                    }
+                cls._version += 1
             
             return ApiResponse(
                 success=True,
@@ -4,37 +4,364 @@ Post service module providing business logic for post operations.
 This module contains the PostService class that handles all post-related
 business logic including retrieving posts, liking posts, creating posts,
 and managing post data with database integration.
+
+Reads are cached in an in-process TTL cache (LISTING_CACHE_TTL_SECONDS).
+Keys are namespaced: posts:... for feed, category, author and single-post
+reads plus cached response bodies, comments:<post_id>:... for comment
+pages. Every successful write clears posts:, and add_comment also clears
+that post's comments: entries after committing. A read that was already
+loading when the entries were cleared does not store its result, so a
+writer sees its change on the next read; other processes may serve stale
+data until the TTL expires. Failed reads are never cached. Cached lists
+and dicts are shared between requests and must not be modified.
 """
 
-from typing import List, Optional, Dict, Any
+from typing import Callable, List, Optional, Dict, Any, Tuple
 from app.models.data_models import LikePostRequest, CreatePostRequest, ApiResponse
-from app.models.auth_models import Post, User, Comment
+from app.models.auth_models import Post, User, Comment, post_likes
 from app.database import get_db
+from app.utils.cache import TTLCache, cached
+from sqlalchemy import exists, func, insert, select, tuple_, update
+from sqlalchemy.orm import Session, joinedload
 import uuid
 from datetime import datetime
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Keyset pagination cursor: (created_at, id) of the last item on a page
+Cursor = Tuple[datetime, str]
+
+# How long a cached listing page may be served before it is rebuilt
+LISTING_CACHE_TTL_SECONDS = 10
+
+# Short-lived cache of feed pages, single posts and comment pages, cleared on every write
+_listing_cache = TTLCache(ttl_seconds=LISTING_CACHE_TTL_SECONDS)
+
+
+def _post_list_query(db: Session):
+    """
+    Build the base query for post listings.
+    
+    Selects plain columns rather than Post entities: the author fields
+    come from a join and the comment count from a correlated subquery,
+    so a whole page is read in one statement with no ORM objects or
+    relationship loads. Rows are shaped by _post_row_to_dict().
+    
+    Args:
+        db (Session): Active database session
+        
+    Returns:
+        Query: Row query joined to the author
+    """
+    comment_count = (
+        select(func.count(Comment.id))
+        .where(Comment.post_id == Post.id)
+        .correlate(Post)
+        .scalar_subquery()
+    )
+    return db.query(
+        Post.id, Post.title, Post.description, Post.category,
+        Post.like_count, Post.is_active, Post.created_at,
+        User.id.label('author_id'),
+        User.full_name.label('author_name'),
+        User.profile_picture_url.label('author_avatar'),
+        User.year_of_study.label('author_year'),
+        User.major.label('author_major'),
+        comment_count.label('comment_count')
+    ).join(User, User.id == Post.author_id)
+
+
+def _post_row_to_dict(row) -> Dict[str, Any]:
+    """
+    Shape a row from _post_list_query() like Post.to_dict().
+    
+    Args:
+        row: Result row with post, author and comment count columns
+        
+    Returns:
+        Dict[str, Any]: Post data for API responses
+    """
+    return {
+        'id': row.id,
+        'title': row.title,
+        'description': row.description,
+        'category': row.category,
+        'author': {
+            'id': row.author_id,
+            'name': row.author_name,
+            'avatar': row.author_avatar,
+            'role': f"{row.author_year} - {row.author_major}"
+        },
+        'likes': row.like_count,
+        'comments': row.comment_count,
+        'timestamp': row.created_at.strftime('%Y-%m-%d %H:%M:%S') if row.created_at else None,
+        'is_active': row.is_active
+    }
+
+
+def _paginate(query, model, limit: int, cursor: Optional[Cursor], descending: bool = True) -> Tuple[list, Optional[Cursor]]:
+    """
+    Apply keyset pagination on (created_at, id) to a query.
+    
+    Args:
+        query: SQLAlchemy query to page through
+        model: Mapped class with created_at and id columns
+        limit (int): Maximum number of rows to return
+        cursor (Cursor, optional): Key of the last row on the previous page
+        descending (bool): Whether to page newest first
+        
+    Returns:
+        Tuple[list, Optional[Cursor]]: Rows on this page and the cursor for the next one
+    """
+    key = tuple_(model.created_at, model.id)
+    if cursor is not None:
+        query = query.filter(key < tuple_(*cursor) if descending else key > tuple_(*cursor))
+    
+    if descending:
+        query = query.order_by(model.created_at.desc(), model.id.desc())
+    else:
+        query = query.order_by(model.created_at.asc(), model.id.asc())
+    
+    # Fetch one extra row to learn whether another page exists
+    rows = query.limit(limit + 1).all()
+    if len(rows) <= limit:
+        return rows, None
+    
+    rows = rows[:limit]
+    return rows, (rows[-1].created_at, rows[-1].id)
+
+
+def _lookup_like_target(db: Session, post_id: str, user_id: str) -> Tuple[Optional[str], Optional[str], bool]:
+    """
+    Fetch the post title, user email and like status in a single query.
+    
+    Args:
+        db (Session): Active database session
+        post_id (str): The ID of the post
+        user_id (str): The ID of the user
+        
+    Returns:
+        Tuple: (post_title, user_email, has_liked), with None for a
+        missing or inactive post and None for a missing user
+    """
+    post_title, user_email, has_liked = db.execute(select(
+        select(Post.title).where(Post.id == post_id, Post.is_active == True).scalar_subquery(),
+        select(User.email).where(User.id == user_id).scalar_subquery(),
+        exists().where(
+            post_likes.c.post_id == post_id,
+            post_likes.c.user_id == user_id
+        )
+    )).one()
+    return post_title, user_email, bool(has_liked)
+
+
+def _has_liked(db: Session, post_id: str, user_id: str) -> bool:
+    """
+    Check the post_likes association table for a like.
+    
+    Args:
+        db (Session): Active database session
+        post_id (str): The ID of the post
+        user_id (str): The ID of the user
+        
+    Returns:
+        bool: True if the like row exists, False otherwise
+    """
+    return bool(db.query(exists().where(
+        post_likes.c.post_id == post_id,
+        post_likes.c.user_id == user_id
+    )).scalar())
+
+
+def _get_like_count(db: Session, post_id: str) -> int:
+    """
+    Read the stored like counter for a post.
+    
+    Args:
+        db (Session): Active database session
+        post_id (str): The ID of the post
+        
+    Returns:
+        int: Number of likes on the post
+    """
+    return db.query(Post.like_count).filter(Post.id == post_id).scalar()
+
+
+def _invalidate_listings(post_id: Optional[str] = None) -> None:
+    """
+    Drop cached feed pages and posts, and a post's comment pages when given.
+    
+    Args:
+        post_id (str, optional): Post whose cached comments are now stale
+    """
+    _listing_cache.delete_prefix("posts:")
+    if post_id is not None:
+        _listing_cache.delete_prefix(f"comments:{post_id}:")
+
+
+@cached(_listing_cache, "posts:all")
+def _load_all_posts(limit: int, cursor: Optional[Cursor]) -> Tuple[List[Dict[str, Any]], Optional[Cursor]]:
+    """
+    Read a feed page from the database.
+    
+    Args:
+        limit (int): Maximum number of posts to return
+        cursor (Cursor, optional): Cursor returned with the previous page
+        
+    Returns:
+        Tuple[List[Dict], Optional[Cursor]]: Posts on this page and the cursor for the next one
+    """
+    with get_db() as db:
+        query = _post_list_query(db).filter(Post.is_active == True)
+        posts, next_cursor = _paginate(query, Post, limit, cursor)
+        return list(map(_post_row_to_dict, posts)), next_cursor
+
+
+@cached(_listing_cache, "posts:id")
+def _load_post(post_id: str) -> Optional[Dict[str, Any]]:
+    """
+    Read a single active post from the database.
+    
+    Args:
+        post_id (str): The unique identifier of the post
+        
+    Returns:
+        Optional[Dict]: The post if found, None otherwise
+    """
+    with get_db() as db:
+        row = _post_list_query(db).filter(
+            Post.id == post_id,
+            Post.is_active == True
+        ).first()
+        return _post_row_to_dict(row) if row is not None else None
+
+
+@cached(_listing_cache, "posts:category")
+def _load_posts_by_category(category: str, limit: int, cursor: Optional[Cursor]) -> Tuple[List[Dict[str, Any]], Optional[Cursor]]:
+    """
+    Read a page of posts by category from the database.
+    
+    Args:
+        category (str): The category to filter by
+        limit (int): Maximum number of posts to return
+        cursor (Cursor, optional): Cursor returned with the previous page
+        
+    Returns:
+        Tuple[List[Dict], Optional[Cursor]]: Posts on this page and the cursor for the next one
+    """
+    with get_db() as db:
+        query = _post_list_query(db).filter(
+            Post.category == category,
+            Post.is_active == True
+        )
+        posts, next_cursor = _paginate(query, Post, limit, cursor)
+        return list(map(_post_row_to_dict, posts)), next_cursor
+
+
+@cached(_listing_cache, "posts:author")
+def _load_posts_by_author(author_id: str, limit: int, cursor: Optional[Cursor]) -> Tuple[List[Dict[str, Any]], Optional[Cursor]]:
+    """
+    Read a page of posts by author ID from the database.
+    
+    Args:
+        author_id (str): The author ID to filter by
+        limit (int): Maximum number of posts to return
+        cursor (Cursor, optional): Cursor returned with the previous page
+        
+    Returns:
+        Tuple[List[Dict], Optional[Cursor]]: Posts on this page and the cursor for the next one
+    """
+    with get_db() as db:
+        query = _post_list_query(db).filter(
+            Post.author_id == author_id,
+            Post.is_active == True
+        )
+        posts, next_cursor = _paginate(query, Post, limit, cursor)
+        return list(map(_post_row_to_dict, posts)), next_cursor
+
+
+@cached(_listing_cache, "comments")
+def _load_post_comments(post_id: str, limit: int, cursor: Optional[Cursor]) -> Tuple[List[Dict[str, Any]], Optional[Cursor]]:
+    """
+    Read a page of a post's comments from the database.
+    
+    Args:
+        post_id (str): The ID of the post
+        limit (int): Maximum number of comments to return
+        cursor (Cursor, optional): Cursor returned with the previous page
+        
+    Returns:
+        Tuple[List[Dict], Optional[Cursor]]: Comments on this page and the cursor for the next one
+    """
+    with get_db() as db:
+        query = db.query(Comment).options(joinedload(Comment.author)).filter(
+            Comment.post_id == post_id,
+            Comment.is_active == True
+        )
+        comments, next_cursor = _paginate(query, Comment, limit, cursor, descending=False)
+        return list(map(Comment.to_dict, comments)), next_cursor
+
 
 class PostService:
     """Service class for handling post-related business logic."""
 
     @classmethod
-    def get_all_posts(cls) -> List[Dict[str, Any]]:
+    def get_all_posts(cls, limit: int = 20, cursor: Optional[Cursor] = None) -> Tuple[List[Dict[str, Any]], Optional[Cursor]]:
         """
-        Retrieve all available posts.
+        Retrieve a page of available posts, newest first.
         
+        Args:
+            limit (int): Maximum number of posts to return
+            cursor (Cursor, optional): Cursor returned with the previous page
+            
         Returns:
-            List[Dict]: List of all posts from database
+            Tuple[List[Dict], Optional[Cursor]]: Posts on this page and the cursor for the next one
         """
         try:
-            with get_db() as db:
-                posts = db.query(Post).filter(Post.is_active == True).order_by(Post.created_at.desc()).all()
-                return [post.to_dict() for post in posts]
+            return _load_all_posts(limit, cursor)
         except Exception as e:
             logger.error(f"Error retrieving posts: {str(e)}")
-            return []
+            return [], None
+
+    @classmethod
+    def get_all_posts_body(
+        cls,
+        limit: int,
+        cursor: Optional[Cursor],
+        render: Callable[[List[Dict[str, Any]], Optional[Cursor]], bytes]
+    ) -> bytes:
+        """
+        Get a serialized response body for a page of the feed.
+        
+        The bytes produced by render are cached alongside the page and
+        invalidated by the same writes, so a repeated request skips both
+        the query and JSON encoding.
+        
+        Args:
+            limit (int): Maximum number of posts to return
+            cursor (Cursor, optional): Cursor returned with the previous page
+            render (Callable): Builds the response body from the posts and next cursor
+            
+        Returns:
+            bytes: Serialized response body
+        """
+        cache_key = f"posts:body:{limit}:{cursor}"
+        body = _listing_cache.get(cache_key)
+        if body is not None:
+            return body
+        
+        generation = _listing_cache.generation
+        try:
+            posts, next_cursor = _load_all_posts(limit, cursor)
+        except Exception as e:
+            logger.error(f"Error retrieving posts: {str(e)}")
+            # Serve an empty page, but don't cache it
+            return render([], None)
+        
+        body = render(posts, next_cursor)
+        _listing_cache.set(cache_key, body, generation)
+        return body
 
     @classmethod
     def get_post_by_id(cls, post_id: str) -> Optional[Dict[str, Any]]:
@@ -48,9 +375,7 @@ class PostService:
             Optional[Dict]: The post if found, None otherwise
         """
         try:
-            with get_db() as db:
-                post = db.query(Post).filter(Post.id == post_id, Post.is_active == True).first()
-                return post.to_dict() if post else None
+            return _load_post(post_id)
         except Exception as e:
             logger.error(f"Error retrieving post {post_id}: {str(e)}")
             return None
@@ -69,42 +394,42 @@ class PostService:
         """
         try:
             with get_db() as db:
-                # Find the post
-                post = db.query(Post).filter(Post.id == post_id, Post.is_active == True).first()
-                if not post:
+                # Find the post, the user and any existing like in one round trip
+                post_title, user_email, has_liked = _lookup_like_target(db, post_id, user_id)
+                if post_title is None:
                     return ApiResponse(
                         success=False,
                         message=f"Post with ID {post_id} not found"
                     )
                 
-                # Find the user
-                user = db.query(User).filter(User.id == user_id).first()
-                if not user:
+                if user_email is None:
                     return ApiResponse(
                         success=False,
                         message="User not found"
                     )
                 
                 # Check if user has already liked this post
-                if user in post.liked_by_users:
+                if has_liked:
                     return ApiResponse(
                         success=False,
                         message="You have already liked this post"
                     )
                 
-                # Add like
-                post.liked_by_users.append(user)
+                # Add like and bump the counter in the same transaction
+                db.execute(post_likes.insert().values(post_id=post_id, user_id=user_id))
+                db.execute(update(Post).where(Post.id == post_id).values(like_count=Post.like_count + 1))
                 db.commit()
+                _invalidate_listings()
                 
-                logger.info(f"User {user.email} liked post {post.title}")
+                logger.info(f"User {user_email} liked post {post_title}")
                 return ApiResponse(
                     success=True,
-                    message=f"Successfully liked post '{post.title}'",
+                    message=f"Successfully liked post '{post_title}'",
                     data={
                         "post_id": post_id,
-                        "post_title": post.title,
+                        "post_title": post_title,
                         "user_id": user_id,
-                        "new_like_count": post.like_count
+                        "new_like_count": _get_like_count(db, post_id)
                     }
                 )
                 
@@ -129,42 +454,45 @@ class PostService:
         """
         try:
             with get_db() as db:
-                # Find the post
-                post = db.query(Post).filter(Post.id == post_id, Post.is_active == True).first()
-                if not post:
+                # Find the post, the user and any existing like in one round trip
+                post_title, user_email, has_liked = _lookup_like_target(db, post_id, user_id)
+                if post_title is None:
                     return ApiResponse(
                         success=False,
                         message=f"Post with ID {post_id} not found"
                     )
                 
-                # Find the user
-                user = db.query(User).filter(User.id == user_id).first()
-                if not user:
+                if user_email is None:
                     return ApiResponse(
                         success=False,
                         message="User not found"
                     )
                 
                 # Check if user has liked this post
-                if user not in post.liked_by_users:
+                if not has_liked:
                     return ApiResponse(
                         success=False,
                         message="You haven't liked this post"
                     )
                 
                 # Remove like
-                post.liked_by_users.remove(user)
+                db.execute(post_likes.delete().where(
+                    post_likes.c.post_id == post_id,
+                    post_likes.c.user_id == user_id
+                ))
+                db.execute(update(Post).where(Post.id == post_id).values(like_count=Post.like_count - 1))
                 db.commit()
+                _invalidate_listings()
                 
-                logger.info(f"User {user.email} unliked post {post.title}")
+                logger.info(f"User {user_email} unliked post {post_title}")
                 return ApiResponse(
                     success=True,
-                    message=f"Successfully unliked post '{post.title}'",
+                    message=f"Successfully unliked post '{post_title}'",
                     data={
                         "post_id": post_id,
-                        "post_title": post.title,
+                        "post_title": post_title,
                         "user_id": user_id,
-                        "new_like_count": post.like_count
+                        "new_like_count": _get_like_count(db, post_id)
                     }
                 )
                 
@@ -197,23 +525,39 @@ class PostService:
                         message="User not found"
                     )
                 
-                # Create new post
-                new_post = Post(
-                    title=create_request.title,
-                    description=create_request.content,  # Map content to description
-                    category=create_request.category,
-                    author_id=author_id
-                )
-                
-                db.add(new_post)
+                # Create new post, reading generated values back with the INSERT
+                post_id, created_at = db.execute(
+                    insert(Post).values(
+                        id=str(uuid.uuid4()),
+                        title=create_request.title,
+                        description=create_request.content,  # Map content to description
+                        category=create_request.category,
+                        author_id=author_id
+                    ).returning(Post.id, Post.created_at)
+                ).one()
                 db.commit()
-                db.refresh(new_post)
+                _invalidate_listings()
                 
-                logger.info(f"User {author.email} created post {new_post.title}")
+                logger.info(f"User {author.email} created post {create_request.title}")
                 return ApiResponse(
                     success=True,
                     message="Post created successfully",
-                    data=new_post.to_dict()
+                    data={
+                        'id': post_id,
+                        'title': create_request.title,
+                        'description': create_request.content,
+                        'category': create_request.category,
+                        'author': {
+                            'id': author.id,
+                            'name': author.full_name,
+                            'avatar': author.profile_picture_url,
+                            'role': f"{author.year_of_study} - {author.major}"
+                        },
+                        'likes': 0,
+                        'comments': 0,
+                        'timestamp': created_at.strftime('%Y-%m-%d %H:%M:%S') if created_at else None,
+                        'is_active': True
+                    }
                 )
                 
         except Exception as e:
@@ -259,13 +603,19 @@ class PostService:
                 post.category = update_request.category
                 
                 db.commit()
-                db.refresh(post)
+                _invalidate_listings()
                 
-                logger.info(f"User {user_id} updated post {post.title}")
+                # Shape the response from one projected row rather than
+                # refreshing the entity and lazy-loading its relationships
+                updated = _post_row_to_dict(
+                    _post_list_query(db).filter(Post.id == post_id).one()
+                )
+                
+                logger.info(f"User {user_id} updated post {update_request.title}")
                 return ApiResponse(
                     success=True,
                     message="Post updated successfully",
-                    data=post.to_dict()
+                    data=updated
                 )
                 
         except Exception as e:
@@ -307,6 +657,7 @@ class PostService:
                 # Soft delete
                 post.is_active = False
                 db.commit()
+                _invalidate_listings()
                 
                 logger.info(f"User {user_id} deleted post {post.title}")
                 return ApiResponse(
@@ -322,48 +673,42 @@ class PostService:
             )
 
     @classmethod
-    def get_posts_by_category(cls, category: str) -> List[Dict[str, Any]]:
+    def get_posts_by_category(cls, category: str, limit: int = 20, cursor: Optional[Cursor] = None) -> Tuple[List[Dict[str, Any]], Optional[Cursor]]:
         """
-        Retrieve posts filtered by category.
+        Retrieve a page of posts filtered by category, newest first.
         
         Args:
             category (str): The category to filter by
+            limit (int): Maximum number of posts to return
+            cursor (Cursor, optional): Cursor returned with the previous page
             
         Returns:
-            List[Dict]: List of posts in the specified category
+            Tuple[List[Dict], Optional[Cursor]]: Posts on this page and the cursor for the next one
         """
         try:
-            with get_db() as db:
-                posts = db.query(Post).filter(
-                    Post.category == category,
-                    Post.is_active == True
-                ).order_by(Post.created_at.desc()).all()
-                return [post.to_dict() for post in posts]
+            return _load_posts_by_category(category, limit, cursor)
         except Exception as e:
             logger.error(f"Error retrieving posts by category {category}: {str(e)}")
-            return []
+            return [], None
 
     @classmethod
-    def get_posts_by_author(cls, author_id: str) -> List[Dict[str, Any]]:
+    def get_posts_by_author(cls, author_id: str, limit: int = 20, cursor: Optional[Cursor] = None) -> Tuple[List[Dict[str, Any]], Optional[Cursor]]:
         """
-        Retrieve posts filtered by author ID.
+        Retrieve a page of posts filtered by author ID, newest first.
         
         Args:
             author_id (str): The author ID to filter by
+            limit (int): Maximum number of posts to return
+            cursor (Cursor, optional): Cursor returned with the previous page
             
         Returns:
-            List[Dict]: List of posts by the specified author
+            Tuple[List[Dict], Optional[Cursor]]: Posts on this page and the cursor for the next one
         """
         try:
-            with get_db() as db:
-                posts = db.query(Post).filter(
-                    Post.author_id == author_id,
-                    Post.is_active == True
-                ).order_by(Post.created_at.desc()).all()
-                return [post.to_dict() for post in posts]
+            return _load_posts_by_author(author_id, limit, cursor)
         except Exception as e:
             logger.error(f"Error retrieving posts by author {author_id}: {str(e)}")
-            return []
+            return [], None
 
     @classmethod
     def add_comment(cls, post_id: str, user_id: str, content: str) -> ApiResponse:
@@ -380,17 +725,15 @@ class PostService:
         """
         try:
             with get_db() as db:
-                # Find the post
-                post = db.query(Post).filter(Post.id == post_id, Post.is_active == True).first()
-                if not post:
+                # Find the post and the user in one round trip
+                post_title, user_email, _ = _lookup_like_target(db, post_id, user_id)
+                if post_title is None:
                     return ApiResponse(
                         success=False,
                         message="Post not found"
                     )
                 
-                # Find the user
-                user = db.query(User).filter(User.id == user_id).first()
-                if not user:
+                if user_email is None:
                     return ApiResponse(
                         success=False,
                         message="User not found"
@@ -405,9 +748,10 @@ class PostService:
                 
                 db.add(comment)
                 db.commit()
+                _invalidate_listings(post_id)
                 db.refresh(comment)
                 
-                logger.info(f"User {user.email} commented on post {post.title}")
+                logger.info(f"User {user_email} commented on post {post_title}")
                 return ApiResponse(
                     success=True,
                     message="Comment added successfully",
@@ -422,26 +766,91 @@ class PostService:
             )
 
     @classmethod
-    def get_post_comments(cls, post_id: str) -> List[Dict[str, Any]]:
+    def add_comments_bulk(cls, entries: List[Tuple[str, str, str]]) -> ApiResponse:
         """
-        Get comments for a post.
+        Add many comments in a single transaction.
+        
+        Posts and users are validated with one query each, then all valid
+        comments are inserted together and committed once. Entries that
+        reference a missing post or user, or have empty content, are
+        skipped and reported back.
         
         Args:
-            post_id (str): The ID of the post
+            entries (List[Tuple[str, str, str]]): (post_id, user_id, content) triples
             
         Returns:
-            List[Dict]: List of comments for the post
+            ApiResponse: Success or error response with created comment IDs
         """
         try:
             with get_db() as db:
-                comments = db.query(Comment).filter(
-                    Comment.post_id == post_id,
-                    Comment.is_active == True
-                ).order_by(Comment.created_at.asc()).all()
-                return [comment.to_dict() for comment in comments]
+                post_ids = {post_id for post_id, _, _ in entries}
+                user_ids = {user_id for _, user_id, _ in entries}
+                active_posts = set(db.scalars(
+                    select(Post.id).where(Post.id.in_(post_ids), Post.is_active == True)
+                ))
+                known_users = set(db.scalars(select(User.id).where(User.id.in_(user_ids))))
+                
+                mappings = []
+                skipped = []
+                for index, (post_id, user_id, content) in enumerate(entries):
+                    content = content.strip()
+                    if post_id not in active_posts or user_id not in known_users or not content:
+                        skipped.append(index)
+                        continue
+                    mappings.append({
+                        "id": str(uuid.uuid4()),
+                        "content": content,
+                        "post_id": post_id,
+                        "author_id": user_id
+                    })
+                
+                if not mappings:
+                    return ApiResponse(
+                        success=False,
+                        message="No valid comments to add",
+                        details={"skipped": skipped}
+                    )
+                
+                db.bulk_insert_mappings(Comment, mappings)
+                db.commit()
+                for post_id in {mapping["post_id"] for mapping in mappings}:
+                    _invalidate_listings(post_id)
+                
+                logger.info(f"Added {len(mappings)} comments in bulk")
+                return ApiResponse(
+                    success=True,
+                    message=f"Added {len(mappings)} comments",
+                    data={
+                        "comment_ids": [mapping["id"] for mapping in mappings],
+                        "skipped": skipped
+                    }
+                )
+                
+        except Exception as e:
+            logger.error(f"Error adding comments in bulk: {str(e)}")
+            return ApiResponse(
+                success=False,
+                message="Failed to add comments"
+            )
+
+    @classmethod
+    def get_post_comments(cls, post_id: str, limit: int = 20, cursor: Optional[Cursor] = None) -> Tuple[List[Dict[str, Any]], Optional[Cursor]]:
+        """
+        Get a page of comments for a post, oldest first.
+        
+        Args:
+            post_id (str): The ID of the post
+            limit (int): Maximum number of comments to return
+            cursor (Cursor, optional): Cursor returned with the previous page
+            
+        Returns:
+            Tuple[List[Dict], Optional[Cursor]]: Comments on this page and the cursor for the next one
+        """
+        try:
+            return _load_post_comments(post_id, limit, cursor)
         except Exception as e:
             logger.error(f"Error retrieving comments for post {post_id}: {str(e)}")
-            return []
+            return [], None
 
     @classmethod
     def check_user_liked_post(cls, post_id: str, user_id: str) -> bool:
@@ -457,15 +866,9 @@ class PostService:
         """
         try:
             with get_db() as db:
-                post = db.query(Post).filter(Post.id == post_id).first()
-                if not post:
-                    return False
-                
-                user = db.query(User).filter(User.id == user_id).first()
-                if not user:
-                    return False
-                
-                return user in post.liked_by_users
+                # A like row can only exist for a real post and user, so the
+                # EXISTS probe alone answers the question
+                return _has_liked(db, post_id, user_id)
         except Exception as e:
             logger.error(f"Error checking if user {user_id} liked post {post_id}: {str(e)}")
-            return False
\ No newline at end of file
+            return False
@@ -16,7 +16,12 @@ from .helpers import (
     handle_request_validation,
     safe_dict_conversion,
     format_list_response,
-    format_single_item_response
+    format_single_item_response,
+    render_list_body,
+    create_json_body_response,
+    encode_cursor,
+    decode_cursor,
+    parse_pagination_args
 )
 
 __all__ = [
@@ -30,5 +35,10 @@ __all__ = [
     'handle_request_validation',
     'safe_dict_conversion',
     'format_list_response',
-    'format_single_item_response'
+    'format_single_item_response',
+    'render_list_body',
+    'create_json_body_response',
+    'encode_cursor',
+    'decode_cursor',
+    'parse_pagination_args'
 ]
\ No newline at end of file
@@ -0,0 +1,139 @@
+"""
+In-process caching utilities.
+
+This module provides a small thread-safe TTL cache used by services to
+keep recently computed read results, with explicit prefix-based
+invalidation on writes. Cached values are handed to every caller as-is,
+so callers must not modify them.
+"""
+
+import functools
+import threading
+import time
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+_MISSING = object()
+
+
+class TTLCache:
+    """Thread-safe in-process cache whose entries expire after a fixed TTL."""
+
+    def __init__(self, ttl_seconds: float, max_entries: int = 1024):
+        """
+        Initialize the cache.
+
+        Args:
+            ttl_seconds (float): Lifetime of each entry in seconds
+            max_entries (int): Maximum number of entries kept at once
+        """
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries: Dict[Hashable, Tuple[float, Any]] = {}
+        self._lock = threading.Lock()
+        # Bumped by every invalidation, so loads that started before one can be dropped
+        self._generation = 0
+
+    @property
+    def generation(self) -> int:
+        """
+        Get the current invalidation generation.
+
+        Read it before loading a value and pass it to set(), so a value
+        loaded before an invalidation is not stored after it.
+
+        Returns:
+            int: Number of invalidations so far
+        """
+        with self._lock:
+            return self._generation
+
+    def get(self, key: Hashable, default: Optional[Any] = None) -> Any:
+        """
+        Get a cached value if present and not expired.
+
+        Args:
+            key (Hashable): Cache key
+            default (Any, optional): Value returned on a miss
+
+        Returns:
+            Any: Cached value, or default on a miss
+        """
+        with self._lock:
+            entry = self._entries.get(key, _MISSING)
+            if entry is _MISSING:
+                return default
+
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return default
+
+            return value
+
+    def set(self, key: Hashable, value: Any, generation: Optional[int] = None) -> None:
+        """
+        Store a value, evicting the oldest entry when the cache is full.
+
+        Args:
+            key (Hashable): Cache key
+            value (Any): Value to cache
+            generation (int, optional): Generation read before the value was
+                loaded; the value is dropped if an invalidation happened since
+        """
+        with self._lock:
+            if generation is not None and generation != self._generation:
+                return
+            self._entries.pop(key, None)
+            if len(self._entries) >= self.max_entries:
+                self._entries.pop(next(iter(self._entries)))
+            self._entries[key] = (time.monotonic() + self.ttl_seconds, value)
+
+    def delete_prefix(self, prefix: str) -> None:
+        """
+        Remove every entry whose string key starts with the given prefix.
+
+        Args:
+            prefix (str): Key prefix to invalidate
+        """
+        with self._lock:
+            self._generation += 1
+            for key in [k for k in self._entries if isinstance(k, str) and k.startswith(prefix)]:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        """Remove every entry."""
+        with self._lock:
+            self._generation += 1
+            self._entries.clear()
+
+
+def cached(cache: TTLCache, prefix: str) -> Callable:
+    """
+    Cache a function's results in a TTLCache.
+    
+    The key is the prefix followed by the positional arguments, joined with
+    ':', so related entries can be dropped together with delete_prefix().
+    None results and raised exceptions are not cached, and neither is a
+    result whose load overlapped an invalidation, since it may predate the
+    write that caused it.
+    
+    Args:
+        cache (TTLCache): Cache to store results in
+        prefix (str): Key namespace for the decorated function
+        
+    Returns:
+        Callable: Decorator for functions taking positional arguments only
+    """
+    def decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
+        def wrapper(*args):
+            key = ":".join([prefix, *map(str, args)])
+            value = cache.get(key)
+            if value is None:
+                generation = cache.generation
+                value = func(*args)
+                if value is not None:
+                    cache.set(key, value, generation)
+            return value
+        return wrapper
+    return decorator
@@ -5,15 +5,38 @@ This module provides helper functions for creating standardized API responses,
 error handling, and common utilities used across the Flask application.
 """
 
-from flask import jsonify
-from typing import Any, Dict, Optional, Union
+from flask import current_app, jsonify
+from typing import Any, Dict, FrozenSet, Optional, Tuple, Union
+from datetime import datetime
+import base64
+import functools
 from app.models.data_models import ApiResponse, ApiErrorResponse
 
+# Page size bounds for paginated list endpoints
+DEFAULT_PAGE_LIMIT = 20
+MAX_PAGE_LIMIT = 100
+
+# Marks errors that must not be served from the error-body cache
+_UNCACHEABLE = object()
+
+# Fixed parts of the common error bodies, in ApiErrorResponse field order;
+# only message and details vary per call
+_NOT_FOUND_BODY = {'success': False, 'message': None, 'error': 'NOT_FOUND', 'details': None}
+_BAD_REQUEST_BODY = {'success': False, 'message': None, 'error': 'BAD_REQUEST', 'details': None}
+_METHOD_NOT_ALLOWED_BODY = {'success': False, 'message': None, 'error': 'METHOD_NOT_ALLOWED', 'details': None}
+_INTERNAL_ERROR_BODY = {
+    'success': False,
+    'message': 'An internal server error occurred',
+    'error': 'INTERNAL_ERROR',
+    'details': None
+}
+
 
 def create_success_response(
     message: str,
     data: Optional[Any] = None,
-    status_code: int = 200
+    status_code: int = 200,
+    pagination: Optional[Dict[str, Any]] = None
 ) -> tuple:
     """
     Create a standardized success response.
@@ -22,6 +45,7 @@ def create_success_response(
         message (str): Success message
         data (Any, optional): Response data
         status_code (int): HTTP status code (default: 200)
+        pagination (dict, optional): Paging metadata for list responses
         
     Returns:
         tuple: (JSON response, status_code)
@@ -34,9 +58,54 @@ def create_success_response(
     if data is not None:
         response_data['data'] = data
     
+    if pagination is not None:
+        response_data['pagination'] = pagination
+    
     return jsonify(response_data), status_code
 
 
+def _details_cache_key(details: Optional[Dict[str, Any]]) -> Any:
+    """
+    Turn error details into a cache key for _build_error_dict().
+    
+    Only string keys and values are cached: equal-hashing values of other
+    types (1, 1.0 and True) would share an entry and report the wrong type,
+    and unhashable ones (e.g. lists) cannot be keys at all.
+    
+    Args:
+        details (dict, optional): Additional error details
+        
+    Returns:
+        frozenset, None or _UNCACHEABLE: Key for _build_error_dict(), or
+        _UNCACHEABLE when the details must be serialized uncached
+    """
+    if details is None:
+        return None
+    
+    if not all(type(k) is str and type(v) is str for k, v in details.items()):
+        return _UNCACHEABLE
+    return frozenset(details.items())
+
+
+@functools.lru_cache(maxsize=256)
+def _build_error_dict(message: str, error_code: str, details_key: Optional[FrozenSet]) -> Dict[str, Any]:
+    """
+    Validate and serialize an error body once per distinct error.
+    
+    The returned dict is shared between calls and must not be modified.
+    
+    Args:
+        message (str): Error message
+        error_code (str): Error code identifier
+        details_key (frozenset, optional): Error details from _details_cache_key()
+        
+    Returns:
+        dict: Serialized ApiErrorResponse
+    """
+    details = dict(details_key) if details_key is not None else None
+    return ApiErrorResponse(message=message, error=error_code, details=details).dict()
+
+
 def create_error_response(
     message: str,
     error_code: str,
@@ -55,13 +124,17 @@ def create_error_response(
     Returns:
         tuple: (JSON response, status_code)
     """
-    error_response = ApiErrorResponse(
-        message=message,
-        error=error_code,
-        details=details
-    )
+    details_key = _details_cache_key(details)
+    if details_key is _UNCACHEABLE or type(message) is not str or type(error_code) is not str:
+        error_data = ApiErrorResponse(
+            message=message,
+            error=error_code,
+            details=details
+        ).dict()
+    else:
+        error_data = _build_error_dict(message, error_code, details_key)
     
-    return jsonify(error_response.dict()), status_code
+    return jsonify(error_data), status_code
 
 
 def create_validation_error_response(validation_errors: list) -> tuple:
@@ -98,11 +171,7 @@ def create_not_found_response(resource: str, resource_id: str = None) -> tuple:
     else:
         message = f"{resource} not found"
     
-    return create_error_response(
-        message=message,
-        error_code="NOT_FOUND",
-        status_code=404
-    )
+    return jsonify({**_NOT_FOUND_BODY, 'message': message}), 404
 
 
 def create_internal_error_response(error_message: str = None) -> tuple:
@@ -115,16 +184,10 @@ def create_internal_error_response(error_message: str = None) -> tuple:
     Returns:
         tuple: (JSON response, status_code)
     """
-    details = None
-    if error_message:
-        details = {"error": error_message}
+    if not error_message:
+        return jsonify(_INTERNAL_ERROR_BODY), 500
     
-    return create_error_response(
-        message="An internal server error occurred",
-        error_code="INTERNAL_ERROR",
-        status_code=500,
-        details=details
-    )
+    return jsonify({**_INTERNAL_ERROR_BODY, 'details': {"error": error_message}}), 500
 
 
 def create_bad_request_response(message: str, details: Optional[Dict[str, Any]] = None) -> tuple:
@@ -138,12 +201,7 @@ def create_bad_request_response(message: str, details: Optional[Dict[str, Any]]
     Returns:
         tuple: (JSON response, status_code)
     """
-    return create_error_response(
-        message=message,
-        error_code="BAD_REQUEST",
-        status_code=400,
-        details=details
-    )
+    return jsonify({**_BAD_REQUEST_BODY, 'message': message, 'details': details}), 400
 
 
 def create_method_not_allowed_response(allowed_methods: list = None) -> tuple:
@@ -163,34 +221,37 @@ def create_method_not_allowed_response(allowed_methods: list = None) -> tuple:
         details = {"allowed_methods": allowed_methods}
         message += f". Allowed methods: {', '.join(allowed_methods)}"
     
-    return create_error_response(
-        message=message,
-        error_code="METHOD_NOT_ALLOWED",
-        status_code=405,
-        details=details
-    )
+    return jsonify({**_METHOD_NOT_ALLOWED_BODY, 'message': message, 'details': details}), 405
 
 
-def handle_request_validation(request, required_json: bool = True) -> Optional[tuple]:
+def handle_request_validation(request, required_json: bool = True) -> Tuple[Optional[tuple], Optional[Any]]:
     """
-    Validate incoming request format and return error response if invalid.
+    Validate incoming request format and return the parsed body.
     
     Args:
         request: Flask request object
         required_json (bool): Whether JSON content is required
         
     Returns:
-        tuple or None: Error response tuple if validation fails, None if valid
+        tuple: (error_response, request_data) where error_response is an
+        error response tuple if validation fails and None if valid, and
+        request_data is the parsed JSON body (None when not required or invalid)
     """
-    if required_json:
-        if not request.is_json:
-            return create_bad_request_response("Request must be JSON")
-        
-        request_data = request.get_json()
-        if not request_data:
-            return create_bad_request_response("Request body is required")
+    if not required_json:
+        return None, None
+    
+    if not request.is_json:
+        return create_bad_request_response("Request must be JSON"), None
+    
+    # Malformed JSON is the client's fault, so answer 400 instead of letting
+    # get_json() raise into the route's catch-all 500 handler
+    request_data = request.get_json(silent=True)
+    if request_data is None and request.get_data():
+        return create_bad_request_response("Request body must be valid JSON"), None
+    if not request_data:
+        return create_bad_request_response("Request body is required"), None
     
-    return None
+    return None, request_data
 
 
 def safe_dict_conversion(obj: Any) -> Any:
@@ -203,24 +264,34 @@ def safe_dict_conversion(obj: Any) -> Any:
     Returns:
         Any: Converted object suitable for JSON serialization
     """
-    if hasattr(obj, 'dict'):
-        # Pydantic model
-        return obj.dict()
-    elif isinstance(obj, list):
-        # List of objects (potentially Pydantic models)
-        return [safe_dict_conversion(item) for item in obj]
-    elif isinstance(obj, dict):
-        # Dictionary - convert values recursively
-        return {key: safe_dict_conversion(value) for key, value in obj.items()}
-    else:
-        # Primitive type or other object
-        return obj
+    # Walk the structure with an explicit stack of (container, key) slots,
+    # replacing each slot with its converted value in place
+    root = [obj]
+    stack = [(root, 0)]
+    while stack:
+        container, key = stack.pop()
+        value = container[key]
+        if hasattr(value, 'dict'):
+            # Pydantic model
+            container[key] = value.dict()
+        elif isinstance(value, list):
+            # List of objects (potentially Pydantic models)
+            converted = list(value)
+            container[key] = converted
+            stack.extend((converted, index) for index in range(len(converted)))
+        elif isinstance(value, dict):
+            # Dictionary - convert values
+            converted = dict(value)
+            container[key] = converted
+            stack.extend((converted, child_key) for child_key in converted)
+    return root[0]
 
 
 def format_list_response(
     items: list,
     message: str = None,
-    resource_name: str = "items"
+    resource_name: str = "items",
+    pagination: Optional[Dict[str, Any]] = None
 ) -> tuple:
     """
     Format a list of items into a standardized response.
@@ -229,6 +300,7 @@ def format_list_response(
         items (list): List of items to return
         message (str, optional): Custom success message
         resource_name (str): Name of the resource for default message
+        pagination (dict, optional): Paging metadata such as limit and next_cursor
         
     Returns:
         tuple: (JSON response, status_code)
@@ -236,16 +308,61 @@ def format_list_response(
     if message is None:
         message = f"{resource_name.capitalize()} retrieved successfully"
     
-    # Convert items to dictionaries if they're Pydantic models
-    items_data = safe_dict_conversion(items)
-    
+    # Pydantic models are serialized by the app's JSON provider
     return create_success_response(
         message=message,
-        data=items_data,
-        status_code=200
+        data=items,
+        status_code=200,
+        pagination=pagination
     )
 
 
+def render_list_body(
+    items: list,
+    message: str,
+    pagination: Optional[Dict[str, Any]] = None
+) -> bytes:
+    """
+    Serialize a list response to JSON bytes for caching.
+    
+    Produces the same body as format_list_response(), including its
+    pretty-printing in debug mode, for use with create_json_body_response().
+    
+    Args:
+        items (list): List of items to return
+        message (str): Success message
+        pagination (dict, optional): Paging metadata such as limit and next_cursor
+        
+    Returns:
+        bytes: Encoded JSON response body
+    """
+    response_data = {
+        'success': True,
+        'message': message,
+        'data': items
+    }
+    
+    if pagination is not None:
+        response_data['pagination'] = pagination
+    
+    # Encode through the provider's response() so compact/debug settings apply as for jsonify()
+    return current_app.json.response(response_data).get_data()
+
+
+def create_json_body_response(body: bytes, status_code: int = 200) -> tuple:
+    """
+    Wrap an already serialized JSON body in a response.
+    
+    Args:
+        body (bytes): Encoded JSON response body
+        status_code (int): HTTP status code (default: 200)
+        
+    Returns:
+        tuple: (JSON response, status_code)
+    """
+    return current_app.response_class(body, mimetype='application/json'), status_code
+
+
 def format_single_item_response(
     item: Any,
     message: str = None,
@@ -265,11 +382,75 @@ def format_single_item_response(
     if message is None:
         message = f"{resource_name.capitalize()} retrieved successfully"
     
-    # Convert item to dictionary if it's a Pydantic model
-    item_data = safe_dict_conversion(item)
-    
+    # Pydantic models are serialized by the app's JSON provider
     return create_success_response(
         message=message,
-        data=item_data,
+        data=item,
         status_code=200
-    )
\ No newline at end of file
+    )
+
+
+def encode_cursor(cursor: Optional[Tuple[datetime, str]]) -> Optional[str]:
+    """
+    Encode a (created_at, id) keyset cursor into an opaque URL-safe token.
+    
+    Args:
+        cursor (tuple, optional): Timestamp and ID of the last item on a page
+        
+    Returns:
+        str or None: Encoded cursor token, or None when there is no next page
+    """
+    if cursor is None:
+        return None
+    
+    created_at, item_id = cursor
+    raw = f"{created_at.isoformat()}|{item_id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def decode_cursor(token: str) -> Tuple[datetime, str]:
+    """
+    Decode a cursor token produced by encode_cursor().
+    
+    Args:
+        token (str): Encoded cursor token
+        
+    Returns:
+        tuple: (created_at, id) of the last item on the previous page
+        
+    Raises:
+        ValueError: If the token is malformed
+    """
+    try:
+        raw = base64.urlsafe_b64decode(token.encode()).decode()
+        created_at, item_id = raw.split('|', 1)
+        return datetime.fromisoformat(created_at), item_id
+    except Exception:
+        raise ValueError("Invalid pagination cursor")
+
+
+def parse_pagination_args(args) -> Tuple[int, Optional[Tuple[datetime, str]]]:
+    """
+    Read limit and cursor query parameters for a paginated list endpoint.
+    
+    Args:
+        args: Request query arguments (request.args)
+        
+    Returns:
+        tuple: (limit, cursor) with cursor None for the first page
+        
+    Raises:
+        ValueError: If limit is not a positive integer or cursor is malformed
+    """
+    try:
+        limit = int(args.get('limit', DEFAULT_PAGE_LIMIT))
+    except (TypeError, ValueError):
+        raise ValueError("limit must be a number")
+    
+    if limit < 1:
+        raise ValueError("limit must be at least 1")
+    
+    token = args.get('cursor')
+    cursor = decode_cursor(token) if token else None
+    
+    return min(limit, MAX_PAGE_LIMIT), cursor
@@ -0,0 +1,103 @@
+"""
+JSON provider backed by orjson.
+
+This module provides a Flask JSON provider that encodes responses with
+orjson when it is installed, and falls back to Flask's default provider
+otherwise.
+"""
+
+from flask.json.provider import DefaultJSONProvider
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """Flask JSON provider that serializes with orjson when available."""
+
+    @staticmethod
+    def default(o):
+        """
+        Convert objects the encoder does not support natively.
+
+        Pydantic models are dumped to dicts here, so responses can carry
+        them directly without a separate conversion pass. Dates and
+        datetimes are passed through by orjson and formatted as HTTP
+        dates, as Flask's default provider does.
+
+        Args:
+            o: Object to convert
+
+        Returns:
+            Any: JSON-serializable representation of the object
+        """
+        if hasattr(o, 'model_dump'):
+            return o.model_dump()
+        return DefaultJSONProvider.default(o)
+
+    def _options(self, pretty: bool = False) -> int:
+        """
+        Build the orjson option flags matching this provider's settings.
+
+        Args:
+            pretty (bool): Whether to indent the output
+
+        Returns:
+            int: Bitmask of orjson options
+        """
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+        if self.sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        if pretty:
+            option |= orjson.OPT_INDENT_2
+        return option
+
+    def dumps(self, obj, **kwargs) -> str:
+        """
+        Serialize data as JSON.
+
+        Args:
+            obj: Data to serialize
+            **kwargs: json.dumps options; when given, the stdlib encoder is used
+
+        Returns:
+            str: JSON string
+        """
+        if orjson is None or kwargs:
+            return super().dumps(obj, **kwargs)
+        return orjson.dumps(obj, default=self.default, option=self._options()).decode()
+
+    def loads(self, s, **kwargs):
+        """
+        Deserialize data as JSON.
+
+        Args:
+            s: JSON text or bytes
+            **kwargs: json.loads options; when given, the stdlib decoder is used
+
+        Returns:
+            Any: Deserialized data
+        """
+        if orjson is None or kwargs:
+            return super().loads(s, **kwargs)
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        """
+        Serialize the given arguments as JSON and return a response.
+
+        Used by flask.jsonify(); encodes straight to bytes so the body is
+        never round-tripped through a Python str.
+
+        Returns:
+            Response: JSON response object
+        """
+        if orjson is None:
+            return super().response(*args, **kwargs)
+
+        obj = self._prepare_response_obj(args, kwargs)
+        pretty = self.compact is False or (self.compact is None and self._app.debug)
+        body = orjson.dumps(obj, default=self.default, option=self._options(pretty))
+        return self._app.response_class(body, mimetype=self.mimetype)
@@ -10,11 +10,30 @@ import os
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
 from app.database import get_db
-from app.models.auth_models import User, Post, Event, Group, Comment
+from app.models.auth_models import User, Post, Event, Group, Comment, post_likes
+from app.data import load_sample_posts
 from werkzeug.security import generate_password_hash
+from sqlalchemy import update
+from collections import Counter
 import uuid
 from datetime import datetime, timedelta
 
+def _build_user(user_data):
+    """Build a verified User from a sample user entry."""
+    user = User(
+        id=user_data.get('custom_id', str(uuid.uuid4())),
+        email=user_data['email'],
+        first_name=user_data['first_name'],
+        last_name=user_data['last_name'],
+        major=user_data['major'],
+        year_of_study=user_data['year_of_study'],
+        bio=user_data['bio'],
+        is_verified=True,
+        is_active=True
+    )
+    user.set_password(user_data['password'])
+    return user
+
 def create_sample_users():
     """Create sample users."""
     # Initialize database first
@@ -61,87 +80,48 @@ def create_sample_users():
         }
     ]
     
-    users = []
     with get_db() as db:
-        for user_data in users_data:
-            # Check if user already exists
-            existing_user = db.query(User).filter(User.email == user_data['email']).first()
-            if existing_user:
-                users.append(existing_user)
-                continue
-                
-            user = User(
-                id=user_data.get('custom_id', str(uuid.uuid4())),
-                email=user_data['email'],
-                first_name=user_data['first_name'],
-                last_name=user_data['last_name'],
-                major=user_data['major'],
-                year_of_study=user_data['year_of_study'],
-                bio=user_data['bio'],
-                is_verified=True,
-                is_active=True
-            )
-            user.set_password(user_data['password'])
-            
-            db.add(user)
-            users.append(user)
+        # Find the users that already exist in one query
+        emails = [user_data['email'] for user_data in users_data]
+        users_by_email = {
+            user.email: user
+            for user in db.query(User).filter(User.email.in_(emails)).all()
+        }
         
+        new_users = [_build_user(user_data) for user_data in users_data
+                     if user_data['email'] not in users_by_email]
+        db.bulk_save_objects(new_users)
+        users_by_email.update((user.email, user) for user in new_users)
+        
+        # Detach the loaded users so they stay readable once the session closes
+        db.expunge_all()
         db.commit()
-        for user in users:
-            db.refresh(user)
     
-    return users
+    return [users_by_email[email] for email in emails]
 
 def create_sample_posts(users):
     """Create sample posts."""
-    posts_data = [
-        {
-            'title': 'Study Group for CS 101 Final Exam',
-            'description': "Hey everyone! I'm organizing a study group for the CS 101 final exam next week. We'll be meeting in the library on Saturday at 2 PM. Bring your notes and let's ace this together!",
-            'category': 'academic',
-            'author_email': 'sarah.chen@university.edu'
-        },
-        {
-            'title': 'Campus Coffee Shop Opens Tomorrow!',
-            'description': "Exciting news! The new Brew & Books café is opening tomorrow in the Student Union building. They'll be serving locally roasted coffee and offering 20% discount to all students with valid ID!",
-            'category': 'announcement',
-            'author_email': 'admin@university.edu'
-        },
-        {
-            'title': 'Looking for Basketball Players',
-            'description': "Our intramural basketball team needs 2 more players for the upcoming season. We practice Tuesdays and Thursdays at 6 PM. No experience necessary, just bring your enthusiasm!",
-            'category': 'social',
-            'author_email': 'mike.rodriguez@university.edu'
-        },
-        {
-            'title': 'Free Tutoring Available',
-            'description': "The Academic Success Center is offering free tutoring sessions for Math, Physics, and Chemistry. Sessions are available Monday through Friday, 10 AM to 8 PM. Book your slot online!",
-            'category': 'academic',
-            'author_email': 'admin@university.edu'
-        }
+    posts_data = load_sample_posts()
+    users_by_email = {u.email: u for u in users}
+    
+    # Skip posts whose author was not created
+    posts = [
+        Post(
+            id=str(uuid.uuid4()),
+            title=post_data['title'],
+            description=post_data['description'],
+            category=post_data['category'],
+            author_id=users_by_email[post_data['author_email']].id
+        )
+        for post_data in posts_data
+        if post_data['author_email'] in users_by_email
     ]
     
-    posts = []
     with get_db() as db:
-        for post_data in posts_data:
-            # Find author
-            author = next((u for u in users if u.email == post_data['author_email']), None)
-            if not author:
-                continue
-                
-            post = Post(
-                title=post_data['title'],
-                description=post_data['description'],
-                category=post_data['category'],
-                author_id=author.id
-            )
-            
-            db.add(post)
-            posts.append(post)
-        
+        # Insert all posts in one batch; IDs are assigned above since
+        # bulk_save_objects does not fetch generated keys back
+        db.bulk_save_objects(posts)
         db.commit()
-        for post in posts:
-            db.refresh(post)
     
     return posts
 
@@ -170,52 +150,54 @@ def create_sample_comments(users, posts):
         }
     ]
     
+    users_by_email = {u.email: u for u in users}
+    posts_by_title = {p.title: p for p in posts}
+    
+    # Skip comments whose author or post was not created
+    comments = [
+        Comment(
+            content=comment_data['content'],
+            post_id=posts_by_title[comment_data['post_title']].id,
+            author_id=users_by_email[comment_data['author_email']].id
+        )
+        for comment_data in comments_data
+        if comment_data['author_email'] in users_by_email
+        and comment_data['post_title'] in posts_by_title
+    ]
+    
     with get_db() as db:
-        for comment_data in comments_data:
-            # Find author
-            author = next((u for u in users if u.email == comment_data['author_email']), None)
-            if not author:
-                continue
-                
-            # Find post
-            post = next((p for p in posts if p.title == comment_data['post_title']), None)
-            if not post:
-                continue
-                
-            comment = Comment(
-                content=comment_data['content'],
-                post_id=post.id,
-                author_id=author.id
-            )
-            
-            db.add(comment)
-        
+        db.bulk_save_objects(comments)
         db.commit()
 
 def create_sample_likes(users, posts):
     """Create sample likes."""
+    users_by_email = {u.email: u for u in users}
+    # Index the sample posts by the title keyword the likes below refer to
+    posts_by_keyword = {
+        keyword: post
+        for post in posts
+        for keyword in ('Basketball', 'Study Group', 'Coffee Shop')
+        if keyword in post.title
+    }
+    
+    sarah = users_by_email.get('sarah.chen@university.edu')
+    mike = users_by_email.get('mike.rodriguez@university.edu')
+    coffee_post = posts_by_keyword.get('Coffee Shop')
+    likes = [
+        (sarah, posts_by_keyword.get('Basketball')),  # Sarah likes Mike's basketball post
+        (mike, posts_by_keyword.get('Study Group')),  # Mike likes Sarah's study group post
+        (sarah, coffee_post),  # Both like the coffee shop announcement
+        (mike, coffee_post)
+    ]
+    like_rows = [{'post_id': post.id, 'user_id': user.id} for user, post in likes if user and post]
+    
     with get_db() as db:
-        # Sarah likes Mike's basketball post
-        sarah = next((u for u in users if u.email == 'sarah.chen@university.edu'), None)
-        basketball_post = next((p for p in posts if 'Basketball' in p.title), None)
-        
-        if sarah and basketball_post:
-            basketball_post.liked_by_users.append(sarah)
-        
-        # Mike likes Sarah's study group post
-        mike = next((u for u in users if u.email == 'mike.rodriguez@university.edu'), None)
-        study_post = next((p for p in posts if 'Study Group' in p.title), None)
-        
-        if mike and study_post:
-            study_post.liked_by_users.append(mike)
+        if like_rows:
+            db.execute(post_likes.insert(), like_rows)
         
-        # Both like the coffee shop announcement
-        coffee_post = next((p for p in posts if 'Coffee Shop' in p.title), None)
-        if coffee_post:
-            if sarah:
-                coffee_post.liked_by_users.append(sarah)
-            if mike:
-                coffee_post.liked_by_users.append(mike)
+        # Keep the denormalized like counters in step with post_likes
+        for post_id, count in Counter(row['post_id'] for row in like_rows).items():
+            db.execute(update(Post).where(Post.id == post_id).values(like_count=Post.like_count + count))
         
         db.commit()
 
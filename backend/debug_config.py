@@ -9,12 +9,12 @@ import sys
 # Add the current directory to Python path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-from app import create_app
-
 def debug_config():
     """Debug Flask configuration."""
     print("Debugging Flask Configuration...")
     
+    # Imported here so loading this module stays cheap
+    from app import create_app
     app = create_app('development')
     
     with app.app_context():
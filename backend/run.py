@@ -3,16 +3,34 @@ Main application entry point for Flask backend API.
 Runs the Flask development server with configuration from environment variables.
 """
 
+import functools
 import os
-from app import create_app
 
 # Get configuration environment from environment variable
 config_name = os.environ.get('FLASK_ENV', 'development')
 
-# Create Flask application using factory pattern
-app = create_app(config_name)
+
+@functools.cache
+def _build_app():
+    """Create the Flask application on first use."""
+    # Imported here so the app package (Flask, SQLAlchemy, Pydantic, mail)
+    # is only loaded when an application is actually needed
+    from app import create_app
+    
+    # Create Flask application using factory pattern
+    return create_app(config_name)
+
+
+def __getattr__(name):
+    """Expose ``app`` lazily so WSGI servers can keep loading ``run:app``."""
+    if name == 'app':
+        return _build_app()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 if __name__ == '__main__':
+    app = _build_app()
+    
     # Run the application
     host = app.config.get('HOST', '127.0.0.1')
     port = app.config.get('PORT', 5000)
@@ -22,4 +40,4 @@ if __name__ == '__main__':
     print(f"Environment: {config_name}")
     print(f"Debug mode: {debug}")
     
-    app.run(host=host, port=port, debug=debug)
\ No newline at end of file
+    app.run(host=host, port=port, debug=debug)
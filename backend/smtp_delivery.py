@@ -0,0 +1,483 @@
+"""
+SMTP delivery helpers for the Zoho test app in test_email.py.
+
+Provides pooled, TLS-resuming SMTP connections, pipelined sends, a batching
+sender that groups queued messages by account, and a credential pool that
+steers sends away from failing accounts. Background threads are started on
+first use, so importing this module has no side effects.
+"""
+
+import hashlib
+import queue
+import re
+import smtplib
+import ssl
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+
+# One client context for every connection, so TLS sessions it issues can be resumed
+_TLS_CONTEXT = ssl.create_default_context()
+# Last TLS session per (host, port), offered again on the next handshake
+_tls_sessions = {}
+
+
+class ResumingSMTP_SSL(smtplib.SMTP_SSL):
+    """SMTP over implicit TLS that resumes the previous TLS session to the same server."""
+
+    def _get_socket(self, host, port, timeout):
+        """Open the TLS socket, offering the last session stored for this server."""
+        self._session_key = (host, port)
+        sock = smtplib.SMTP._get_socket(self, host, port, timeout)
+        return self.context.wrap_socket(sock, server_hostname=self._host,
+                                        session=_tls_sessions.get(self._session_key))
+
+    def remember_session(self):
+        """Store this connection's TLS session for the next connect to the same server."""
+        if self.sock.session is not None:
+            _tls_sessions[self._session_key] = self.sock.session
+
+
+class SMTPConnectionPool:
+    """
+    Keeps authenticated SMTP connections open between sends, keyed by (host, port, user).
+
+    The key also carries a digest of the password, so a session opened with
+    one password is never handed to a caller presenting a different one.
+    """
+
+    def __init__(self, host, port, max_size=4, idle_timeout=60):
+        """
+        Initialize the pool; the idle-connection reaper starts with the first checkout.
+
+        Args:
+            host (str): SMTP server host name
+            port (int): SMTP submission port (implicit TLS)
+            max_size (int): Idle connections kept per key
+            idle_timeout (float): Seconds an idle connection is kept open
+        """
+        self.host = host
+        self.port = port
+        self.max_size = max_size
+        self.idle_timeout = idle_timeout
+        # Idle (connection, last_used) pairs per (host, port, user, password digest)
+        self._idle = {}
+        # Key of every connection currently checked out
+        self._owners = {}
+        self._lock = threading.Lock()
+        self._reaper = None
+
+    def _queue(self, key):
+        """
+        Get the idle-connection queue for a key, creating it and the reaper if needed.
+
+        Args:
+            key (tuple): (host, port, user, password digest)
+
+        Returns:
+            queue.Queue: Idle (connection, last_used) pairs for the key
+        """
+        with self._lock:
+            if self._reaper is None:
+                self._reaper = threading.Thread(target=self._reap_idle, daemon=True)
+                self._reaper.start()
+            return self._idle.setdefault(key, queue.Queue(maxsize=self.max_size))
+
+    def _connect(self, user, password):
+        """
+        Open and authenticate a new connection.
+
+        Args:
+            user (str): SMTP login
+            password (str): SMTP password
+
+        Returns:
+            ResumingSMTP_SSL: Logged-in connection
+        """
+        conn = ResumingSMTP_SSL(self.host, self.port, timeout=30, context=_TLS_CONTEXT)
+        try:
+            # login() sends the session's only EHLO; its reply also drives PIPELINING and AUTH selection
+            conn.login(user, password)
+            # TLS 1.3 tickets arrive after the handshake, so read the session once the server has replied
+            conn.remember_session()
+        except Exception:
+            self._close(conn)
+            raise
+        return conn
+
+    @staticmethod
+    def _close(conn):
+        """Say QUIT if the server is still listening, otherwise just drop the socket."""
+        try:
+            conn.quit()
+        except Exception:
+            conn.close()
+
+    def acquire(self, user, password):
+        """
+        Check out a live connection, reusing an idle one when NOOP confirms it.
+
+        Args:
+            user (str): SMTP login
+            password (str): SMTP password
+
+        Returns:
+            smtplib.SMTP: Authenticated connection; hand it back with release()
+        """
+        key = (self.host, self.port, user, hashlib.sha256(password.encode()).digest())
+        idle = self._queue(key)
+        while True:
+            try:
+                conn, _ = idle.get_nowait()
+            except queue.Empty:
+                conn = self._connect(user, password)
+                break
+            try:
+                if conn.noop()[0] == 250:
+                    break
+            except (smtplib.SMTPException, OSError):
+                pass
+            self._close(conn)
+
+        with self._lock:
+            self._owners[conn] = key
+        return conn
+
+    def release(self, conn, reusable=True):
+        """
+        Return a connection to the pool, or close it if it can't be reused.
+
+        Args:
+            conn (smtplib.SMTP): Connection obtained from acquire()
+            reusable (bool): False when the server dropped the session
+        """
+        with self._lock:
+            key = self._owners.pop(conn)
+        if reusable:
+            try:
+                self._queue(key).put_nowait((conn, time.monotonic()))
+                return
+            except queue.Full:
+                pass
+        self._close(conn)
+
+    def _reap_idle(self):
+        """Close connections left idle longer than idle_timeout; runs on the reaper thread."""
+        while True:
+            time.sleep(self.idle_timeout / 2)
+            cutoff = time.monotonic() - self.idle_timeout
+            with self._lock:
+                queues = list(self._idle.values())
+            for idle in queues:
+                for _ in range(idle.qsize()):
+                    try:
+                        conn, last_used = idle.get_nowait()
+                    except queue.Empty:
+                        break
+                    if last_used < cutoff:
+                        self._close(conn)
+                        continue
+                    try:
+                        idle.put_nowait((conn, last_used))
+                    except queue.Full:
+                        self._close(conn)
+
+
+# Errors after which the SMTP session can't carry further commands
+SESSION_LOST_ERRORS = (smtplib.SMTPServerDisconnected, ConnectionError, TimeoutError)
+
+# Lines starting with '.' must be dot-stuffed inside DATA (RFC 5321 4.5.2)
+_LEADING_DOT = re.compile(rb'(?m)^\.')
+
+
+def _check_address(address):
+    """Reject an envelope address that could smuggle extra SMTP commands, as putcmd() does."""
+    if '\r' in address or '\n' in address:
+        raise ValueError('command and arguments contain prohibited newline characters')
+    if not address.isascii():
+        raise ValueError('envelope addresses must be ASCII')
+
+
+def send_pipelined(conn, sender, recipient, message):
+    """
+    Send one message, batching MAIL, RCPT and DATA when the server allows it.
+
+    With PIPELINING (RFC 2920) the three commands go out in one write and
+    their replies are read afterwards, saving two round trips over
+    sendmail(). Without it this is a plain sendmail() call.
+
+    Args:
+        conn (smtplib.SMTP): Connected, authenticated session
+        sender (str): Envelope sender
+        recipient (str): Envelope recipient
+        message (bytes): Full message with CRLF line endings
+
+    Raises:
+        ValueError: If an address contains CR, LF or non-ASCII characters
+        SMTPSenderRefused, SMTPRecipientsRefused, SMTPDataError: As sendmail() does
+    """
+    _check_address(sender)
+    _check_address(recipient)
+    conn.ehlo_or_helo_if_needed()
+    if not conn.has_extn('pipelining'):
+        conn.sendmail(sender, recipient, message)
+        return
+
+    conn.send(f"MAIL FROM:<{sender}>\r\nRCPT TO:<{recipient}>\r\nDATA\r\n")
+    mail_code, mail_resp = conn.getreply()
+    rcpt_code, rcpt_resp = conn.getreply()
+    data_code, data_resp = conn.getreply()
+
+    if data_code == 354 and (mail_code != 250 or rcpt_code not in (250, 251)):
+        # The server took DATA despite a refusal; end it empty so the session stays usable
+        conn.send(b".\r\n")
+        conn.getreply()
+    if mail_code != 250:
+        conn.rset()
+        raise smtplib.SMTPSenderRefused(mail_code, mail_resp, sender)
+    if rcpt_code not in (250, 251):
+        conn.rset()
+        raise smtplib.SMTPRecipientsRefused({recipient: (rcpt_code, rcpt_resp)})
+    if data_code != 354:
+        conn.rset()
+        raise smtplib.SMTPDataError(data_code, data_resp)
+
+    body = _LEADING_DOT.sub(b'..', message)
+    if not body.endswith(b"\r\n"):
+        body += b"\r\n"
+    conn.send(body + b".\r\n")
+    code, resp = conn.getreply()
+    if code != 250:
+        conn.rset()
+        raise smtplib.SMTPDataError(code, resp)
+
+
+class _SendJob:
+    """One queued message and the slot its outcome is reported in."""
+
+    __slots__ = ('user', 'password', 'recipient', 'message', 'error', 'done')
+
+    def __init__(self, user, password, recipient, message):
+        """
+        Initialize a pending job.
+
+        Args:
+            user (str): SMTP login, also used as the envelope sender
+            password (str): SMTP password; cleared once the job finishes
+            recipient (str): Envelope recipient
+            message (bytes): Full message with CRLF line endings
+        """
+        self.user = user
+        self.password = password
+        self.recipient = recipient
+        self.message = message
+        self.error = None
+        self.done = threading.Event()
+
+
+class BatchSender:
+    """Group-commits queued sends so each batch shares one SMTP session per account."""
+
+    def __init__(self, pool, max_batch=64, max_wait=0.01, max_workers=8):
+        """
+        Initialize the sender; its threads start with the first submitted message.
+
+        Args:
+            pool (SMTPConnectionPool): Pool the sessions are taken from
+            max_batch (int): Most messages drained into one batch
+            max_wait (float): Seconds to wait for a batch to fill after its first message
+            max_workers (int): Account groups delivered at the same time
+        """
+        self.pool = pool
+        self.max_batch = max_batch
+        self.max_wait = max_wait
+        self.max_workers = max_workers
+        self._pending = queue.Queue()
+        self._delivery = None
+        self._start_lock = threading.Lock()
+
+    def _start(self):
+        """Start the batching thread and the delivery workers unless already running."""
+        with self._start_lock:
+            if self._delivery is not None:
+                return
+            # Each account group is delivered on its own worker, so one slow server doesn't stall the rest
+            self._delivery = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix='smtp-batch')
+            threading.Thread(target=self._run, daemon=True).start()
+
+    def submit(self, user, password, recipient, message):
+        """
+        Queue a message for the next batch.
+
+        Args:
+            user (str): SMTP login, also used as the envelope sender
+            password (str): SMTP password
+            recipient (str): Envelope recipient
+            message (bytes): Full message including headers, with CRLF line endings
+
+        Returns:
+            _SendJob: Job whose done event is set once the send was attempted
+        """
+        self._start()
+        job = _SendJob(user, password, recipient, message)
+        self._pending.put(job)
+        return job
+
+    def _run(self):
+        """Drain queued jobs into batches and hand each account's share to a worker."""
+        while True:
+            batch = [self._pending.get()]
+            deadline = time.monotonic() + self.max_wait
+            while len(batch) < self.max_batch:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self._pending.get(timeout=remaining))
+                except queue.Empty:
+                    break
+
+            groups = {}
+            for job in batch:
+                groups.setdefault((job.user, job.password), []).append(job)
+            for (user, password), jobs in groups.items():
+                self._delivery.submit(self._deliver, user, password, jobs)
+
+    def _deliver(self, user, password, jobs):
+        """
+        Send one account's jobs over a single pooled session.
+
+        Args:
+            user (str): SMTP login shared by the jobs
+            password (str): SMTP password shared by the jobs
+            jobs (list): _SendJob instances to send, in order
+        """
+        try:
+            conn = self.pool.acquire(user, password)
+        except Exception as e:
+            for job in jobs:
+                job.error = str(e)
+                self._finish(job)
+            return
+
+        reusable = True
+        try:
+            for job in jobs:
+                if not reusable:
+                    job.error = "SMTP session closed before this message was sent"
+                    continue
+                try:
+                    send_pipelined(conn, user, job.recipient, job.message)
+                except SESSION_LOST_ERRORS as e:
+                    reusable = False
+                    job.error = str(e)
+                except Exception as e:
+                    job.error = str(e)
+        finally:
+            self.pool.release(conn, reusable)
+            for job in jobs:
+                self._finish(job)
+
+    @staticmethod
+    def _finish(job):
+        """Mark a job done, dropping its credential since finished jobs stay reachable."""
+        job.password = None
+        job.done.set()
+
+
+# An account with more than MAX_ACCOUNT_FAILURES failures within the window is skipped
+MAX_ACCOUNT_FAILURES = 3
+FAILURE_WINDOW_SECONDS = 300
+# Recent failure times per (email, password digest), shared by every CredentialPool;
+# keying on the password too means a caller sending bad passwords for an
+# address can't blacklist it for callers holding the right one. Accounts
+# whose failures have all aged out of the window are dropped
+_account_failures = {}
+_account_failures_lock = threading.Lock()
+# Errors that say the account or its server is unhealthy, rather than the message
+ACCOUNT_ERRORS = (smtplib.SMTPAuthenticationError, smtplib.SMTPConnectError) + SESSION_LOST_ERRORS
+
+
+def _account_key(email, password):
+    """Key an account's failures by its email and a digest of the password used."""
+    return email, hashlib.sha256(password.encode()).digest()
+
+
+def _recent_failures(key, cutoff):
+    """Drop an account's failures older than cutoff and return how many are left; call under the lock."""
+    failures = _account_failures.get(key)
+    if failures is None:
+        return 0
+    while failures and failures[0] < cutoff:
+        failures.popleft()
+    if not failures:
+        del _account_failures[key]
+    return len(failures)
+
+
+@dataclass
+class CredentialPool:
+    """Spreads sends over several accounts, favouring the ones failing least."""
+
+    credentials: list
+    _next: int = field(default=0, repr=False)
+
+    def pick(self):
+        """
+        Choose the account with the fewest recent failures, rotating between ties.
+
+        Returns:
+            tuple: (email, password), or None when every account is blacklisted
+        """
+        cutoff = time.monotonic() - FAILURE_WINDOW_SECONDS
+        best, best_failures = None, None
+        with _account_failures_lock:
+            start = self._next
+            self._next += 1
+            for i in range(len(self.credentials)):
+                email, password = self.credentials[(start + i) % len(self.credentials)]
+                failures = _recent_failures(_account_key(email, password), cutoff)
+                if failures > MAX_ACCOUNT_FAILURES:
+                    continue
+                if best is None or failures < best_failures:
+                    best, best_failures = (email, password), failures
+        return best
+
+    def record_failure(self, email, password):
+        """
+        Count a failure against an account for the blacklist window.
+
+        Args:
+            email (str): SMTP login that failed
+            password (str): Password it was tried with
+        """
+        now = time.monotonic()
+        with _account_failures_lock:
+            # Prune every account here too, so ones never picked again don't linger
+            for known in list(_account_failures):
+                _recent_failures(known, now - FAILURE_WINDOW_SECONDS)
+            _account_failures.setdefault(_account_key(email, password), deque()).append(now)
+
+
+def send_once(pool, user, password, recipient, message):
+    """
+    Send one message over a pooled session, discarding the session if it was lost.
+
+    Args:
+        pool (SMTPConnectionPool): Pool to take the session from
+        user (str): SMTP login, also used as the envelope sender
+        password (str): SMTP password
+        recipient (str): Envelope recipient
+        message (bytes): Full message with CRLF line endings
+    """
+    conn = pool.acquire(user, password)
+    reusable = True
+    try:
+        send_pipelined(conn, user, recipient, message)
+    except SESSION_LOST_ERRORS:
+        reusable = False
+        raise
+    finally:
+        pool.release(conn, reusable)
@@ -3,29 +3,74 @@
 Test database functionality.
 """
 
+import contextlib
+import functools
 import os
 import sys
 
 # Add the current directory to Python path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-from app.database import init_database, get_db
-from app.models.auth_models import User
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from app import database
+from app.database import init_database
+from app.models.auth_models import User, Event, Group, Post, Comment
 from app.config import Config
 
+# Built once; SQLAlchemy's compiled-statement cache keys on its structure
+_COUNT_STMTS = {
+    model: select(func.count()).select_from(model)
+    for model in (User, Event, Group, Post, Comment)
+}
+
+@functools.lru_cache(maxsize=1)
+def _ensure_db(uri):
+    """Initialize the database once per URI so repeated runs reuse the engine and its pool."""
+    init_database(uri)
+    return True
+
+@contextlib.contextmanager
+def ephemeral_db():
+    """
+    Yield a session whose changes are all rolled back on exit.
+    
+    The session joins an outer transaction on its own connection and turns
+    its commits into SAVEPOINT releases, so repeated runs share one engine
+    and leave the database untouched.
+    
+    Yields:
+        Session: SQLAlchemy database session
+    """
+    _ensure_db(Config.SQLALCHEMY_DATABASE_URI)
+    connection = database.engine.connect()
+    transaction = connection.begin()
+    session = Session(bind=connection, join_transaction_mode="create_savepoint")
+    try:
+        yield session
+    finally:
+        session.close()
+        transaction.rollback()
+        connection.close()
+
+def _count_model(db, model):
+    """Count a model's rows with a flat Core SELECT COUNT(*), hydrating no instances."""
+    return db.execute(_COUNT_STMTS[model]).scalar()
+
 def test_database():
     """Test basic database operations."""
     print("Testing database functionality...")
     
     try:
-        # Initialize database
-        init_database(Config.SQLALCHEMY_DATABASE_URI)
-        print("✓ Database initialized")
-        
-        # Test basic query
-        with get_db() as db:
-            user_count = db.query(User).count()
-            print(f"✓ Database query successful - Found {user_count} users")
+        # Initialize database and open a session that rolls back on exit
+        with ephemeral_db() as db:
+            print("✓ Database initialized")
+            
+            # Probe every model through the same session and transaction
+            for model in _COUNT_STMTS:
+                count = _count_model(db, model)
+                print(f"✓ Database query successful - Found {count} {model.__tablename__}")
         
         print("✓ Database is working correctly!")
         return True
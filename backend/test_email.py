@@ -1,10 +1,65 @@
+"""
+Standalone Flask app for testing SMTP delivery through Zoho.
+
+Sends use blocking smtplib rather than an async client such as
+aiosmtplib. Flask runs an async view to completion on a fresh event loop
+in the worker that received the request, so it would not free that
+worker, and async SMTP connections could not outlive the request to be
+reused by the next one. The SMTP machinery lives in smtp_delivery.py.
+"""
+
 from flask import Flask, request, jsonify
+import os
 import smtplib
+import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+from smtp_delivery import ACCOUNT_ERRORS, BatchSender, CredentialPool, SMTPConnectionPool, send_once
 
 app = Flask(__name__)
 
+# Neither starts a thread until its first send
+smtp_pool = SMTPConnectionPool('smtp.zoho.com', 465)
+batch_sender = BatchSender(smtp_pool)
+
+SEND_TIMEOUT_SECONDS = 60
+
+# Accepted /test_email jobs by id, oldest first; trimmed to MAX_TRACKED_JOBS
+MAX_TRACKED_JOBS = 10000
+_jobs = {}
+_jobs_lock = threading.Lock()
+
+# Most recipients one /test_email/batch request may list
+MAX_BATCH_RECIPIENTS = 100
+
+# Limits on one /bulk_email request; the worker count no longer grows with the input
+MAX_BULK_CREDENTIALS = 10
+MAX_BULK_MESSAGES = 100
+MAX_BULK_WORKERS = 16
+
+# Encoded once with CRLF line endings, so sendmail() sends it as-is
+EMAIL_MESSAGE = b"Subject: SMTP Test\r\n\r\nTest email sent from Flask via Zoho SMTP.\r\n"
+
+
+def _wait_for(job):
+    """
+    Block until a queued job finishes or SEND_TIMEOUT_SECONDS pass.
+
+    Args:
+        job (_SendJob): Job returned by BatchSender.submit()
+
+    Returns:
+        str: Error message, or None if the message was sent
+    """
+    if not job.done.wait(SEND_TIMEOUT_SECONDS):
+        return "Timed out waiting for the SMTP server"
+    return job.error
+
+
 @app.route('/test_email', methods=['POST'])
 def test_email():
+    """Queue one test message and answer 202 with a job id to poll."""
     data = request.get_json()
 
     # Access email and password correctly by key names, not values
@@ -12,19 +67,183 @@ def test_email():
     zoho_password = data['password']
     recipient = data.get('recipient', zoho_email)  # default to sender
 
-    subject = "SMTP Test"
-    body = "Test email sent from Flask via Zoho SMTP."
+    # Hand the send to the batch worker and answer right away; poll the status route for the outcome
+    job = batch_sender.submit(zoho_email, zoho_password, recipient, EMAIL_MESSAGE)
+    job_id = uuid.uuid4().hex
+    with _jobs_lock:
+        _jobs[job_id] = job
+        while len(_jobs) > MAX_TRACKED_JOBS:
+            del _jobs[next(iter(_jobs))]
+    return jsonify({"status": "accepted", "job_id": job_id}), 202
+
+
+@app.route('/test_email/status/<job_id>', methods=['GET'])
+def test_email_status(job_id):
+    """
+    Report the outcome of a job accepted by /test_email.
+
+    Args:
+        job_id (str): Id returned in the 202 response
+    """
+    with _jobs_lock:
+        job = _jobs.get(job_id)
+    if job is None:
+        return jsonify({"status": "error", "message": "Unknown job id"}), 404
+    if not job.done.is_set():
+        return jsonify({"status": "pending"})
+    if job.error:
+        return jsonify({"status": "error", "message": job.error})
+    return jsonify({"status": "success", "message": "Email sent!"})
+
+
+def _batch_payload_error(data):
+    """
+    Check the shape of a /test_email/batch body.
+
+    Args:
+        data: Parsed JSON body, or None if it was not valid JSON
+
+    Returns:
+        str: Description of the first problem found, or None if the body is valid
+    """
+    if not isinstance(data, dict):
+        return "Request body must be a JSON object"
+    if not isinstance(data.get('email'), str) or not isinstance(data.get('password'), str):
+        return "'email' and 'password' must be strings"
+    recipients = data.get('recipients')
+    if recipients is None:
+        return None
+    if not isinstance(recipients, list) or not recipients:
+        return "'recipients' must be a non-empty list"
+    if len(recipients) > MAX_BATCH_RECIPIENTS:
+        return f"'recipients' may list at most {MAX_BATCH_RECIPIENTS} addresses"
+    if not all(isinstance(r, str) for r in recipients):
+        return "Each entry in 'recipients' must be a string"
+    return None
+
+
+@app.route('/test_email/batch', methods=['POST'])
+def test_email_batch():
+    """Queue one test message per recipient and wait for every outcome."""
+    data = request.get_json(silent=True)
+    error = _batch_payload_error(data)
+    if error:
+        return jsonify({"status": "error", "message": error}), 400
+
+    zoho_email = data['email']
+    zoho_password = data['password']
+    recipients = data.get('recipients') or [zoho_email]
+
+    # Queue everything first so the worker can drain it into as few sessions as possible
+    jobs = [batch_sender.submit(zoho_email, zoho_password, recipient, EMAIL_MESSAGE)
+            for recipient in recipients]
+
+    results = []
+    for recipient, job in zip(recipients, jobs):
+        error = _wait_for(job)
+        results.append({
+            "recipient": recipient,
+            "status": "error" if error else "success",
+            "message": error or "Email sent!"
+        })
+
+    status = "success" if all(r["status"] == "success" for r in results) else "error"
+    return jsonify({"status": status, "results": results})
+
+
+def _send_with_any(credentials, recipient):
+    """
+    Send the test message from the first healthy account that can deliver it.
+
+    Moves on to another account when one can't log in or connect;
+    message-level errors are final.
+
+    Args:
+        credentials (CredentialPool): Accounts to send from
+        recipient (str): Envelope recipient
+
+    Returns:
+        str: Error message, or None if the message was sent
+    """
+    error = "No account is currently available"
+    for _ in credentials.credentials:
+        picked = credentials.pick()
+        if picked is None:
+            break
+        user, password = picked
+        try:
+            send_once(smtp_pool, user, password, recipient, EMAIL_MESSAGE)
+            return None
+        except ACCOUNT_ERRORS as e:
+            credentials.record_failure(user, password)
+            error = str(e)
+        except smtplib.SMTPException as e:
+            # Refused recipients and data are about the message, not the account
+            return str(e)
+        except OSError as e:
+            # Socket and TLS failures reaching the server
+            credentials.record_failure(user, password)
+            error = str(e)
+        except Exception as e:
+            return str(e)
+    return error
+
+
+def _bulk_payload_error(data):
+    """
+    Check the shape of a /bulk_email body.
+
+    Args:
+        data: Parsed JSON body, or None if it was not valid JSON
+
+    Returns:
+        str: Description of the first problem found, or None if the body is valid
+    """
+    if not isinstance(data, dict):
+        return "Request body must be a JSON object"
+    creds = data.get('creds')
+    if not isinstance(creds, list) or not creds:
+        return "'creds' must be a non-empty list"
+    if len(creds) > MAX_BULK_CREDENTIALS:
+        return f"'creds' may list at most {MAX_BULK_CREDENTIALS} accounts"
+    if not all(isinstance(c, dict) and isinstance(c.get('email'), str) and isinstance(c.get('password'), str)
+               for c in creds):
+        return "Each entry in 'creds' needs string 'email' and 'password' fields"
+    messages = data.get('messages')
+    if not isinstance(messages, list) or not messages:
+        return "'messages' must be a non-empty list"
+    if len(messages) > MAX_BULK_MESSAGES:
+        return f"'messages' may list at most {MAX_BULK_MESSAGES} messages"
+    if not all(isinstance(m, dict) and isinstance(m.get('recipient'), str) for m in messages):
+        return "Each entry in 'messages' needs a string 'recipient' field"
+    return None
+
+
+@app.route('/bulk_email', methods=['POST'])
+def bulk_email():
+    """Send the test message to every listed recipient, spreading sends over the given accounts."""
+    data = request.get_json(silent=True)
+    error = _bulk_payload_error(data)
+    if error:
+        return jsonify({"status": "error", "message": error}), 400
+
+    credentials = CredentialPool([(c['email'], c['password']) for c in data['creds']])
+    recipients = [m['recipient'] for m in data['messages']]
+
+    # A few sends per account in flight at once, so one slow account doesn't hold up the rest
+    workers = min(len(credentials.credentials) * 4, len(recipients), MAX_BULK_WORKERS)
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        errors = list(executor.map(lambda recipient: _send_with_any(credentials, recipient), recipients))
 
-    email_message = f"Subject: {subject}\n\n{body}"
+    results = [{
+        "recipient": recipient,
+        "status": "error" if error else "success",
+        "message": error or "Email sent!"
+    } for recipient, error in zip(recipients, errors)]
 
-    try:
-        with smtplib.SMTP('smtp.zoho.com', 587) as server:
-            server.starttls()
-            server.login(zoho_email, zoho_password)
-            server.sendmail(zoho_email, recipient, email_message)
-        return jsonify({"status": "success", "message": "Email sent!"})
-    except Exception as e:
-        return jsonify({"status": "error", "message": str(e)})
+    status = "success" if not any(errors) else "error"
+    return jsonify({"status": status, "results": results})
 
 if __name__ == '__main__':
-    app.run(debug=True)
+    # Debug mode (reloader and debugger) only on request; see test_email_wsgi.py for serving under load
+    app.run(debug=os.getenv('FLASK_DEBUG') == '1', threaded=True)
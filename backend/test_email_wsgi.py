@@ -0,0 +1,13 @@
+"""
+WSGI entry point for the SMTP test app in test_email.py.
+
+Serve it with a production WSGI server instead of the debug server, e.g.:
+
+    gunicorn -w 1 -k gthread --threads 8 test_email_wsgi:application
+
+Keep a single worker process: jobs accepted by /test_email are tracked in
+that process's memory, so /test_email/status/<job_id> must reach the same
+process. Its threads share the SMTP connection pool and the batch sender.
+"""
+
+from test_email import app as application
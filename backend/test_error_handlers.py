@@ -6,50 +6,125 @@ This script tests the error handling functionality by making requests
 to non-existent endpoints and checking the response format.
 """
 
+import functools
+import io
 import json
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from werkzeug.test import create_environ
 from app import create_app
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
-def test_error_handlers():
-    """Test the centralized error handlers."""
-    app = create_app()
+# (label, method, path, data, content_type, expected_status, expected_error) per probe, in report order
+PROBES = [
+    ("1. Testing 404 Not Found:", 'GET', '/api/nonexistent', None, None, 404, 'NOT_FOUND'),
+    # Health endpoint only accepts GET
+    ("2. Testing 405 Method Not Allowed:", 'POST', '/health', None, None, 405, 'METHOD_NOT_ALLOWED'),
+    ("3. Testing 400 Bad Request (if events endpoint exists):",
+     'POST', '/api/events/1/join', "invalid json", 'application/json', 400, 'BAD_REQUEST'),
+    ("4. Testing successful response (health check):", 'GET', '/health', None, None, 200, None),
+    # One comment over the route's MAX_COMMENT_BATCH of 100
+    ("5. Testing 400 for an oversized comment batch:", 'POST', '/api/posts/comments/batch',
+     json.dumps({"comments": [{"post_id": "1", "comment": "hi"}] * 101}), 'application/json',
+     400, 'BAD_REQUEST'),
+]
+
+# WSGI environ and request body per probe, built once; each run copies the environ
+_ENVIRONS = []
+for _, method, path, data, content_type, *_ in PROBES:
+    environ = create_environ(path=path, method=method, data=data, content_type=content_type)
+    _ENVIRONS.append((environ, environ.pop('wsgi.input').read()))
+
+
+def _pretty_json(data):
+    """Indent data for printing, with orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(data, indent=2)
+
+
+def _call_wsgi(app, environ_and_body):
+    """
+    Dispatch one probe straight through the app's WSGI callable.
     
-    with app.test_client() as client:
-        print("Testing centralized error handlers...")
-        print("=" * 50)
+    Args:
+        app (Flask): App to call
+        environ_and_body (tuple): Prebuilt environ and its request body
         
-        # Test 404 Not Found
-        print("\n1. Testing 404 Not Found:")
-        response = client.get('/api/nonexistent')
-        print(f"Status Code: {response.status_code}")
-        print(f"Response: {json.dumps(response.get_json(), indent=2)}")
-        
-        # Test 405 Method Not Allowed
-        print("\n2. Testing 405 Method Not Allowed:")
-        response = client.post('/health')  # Health endpoint only accepts GET
-        print(f"Status Code: {response.status_code}")
-        print(f"Response: {json.dumps(response.get_json(), indent=2)}")
-        
-        # Test 400 Bad Request (malformed JSON)
-        print("\n3. Testing 400 Bad Request (if events endpoint exists):")
+    Returns:
+        tuple: (status_code, parsed JSON body), or the exception raised
+    """
+    template, body = environ_and_body
+    environ = dict(template)
+    environ['wsgi.input'] = io.BytesIO(body)
+    status = []
+    
+    def start_response(status_line, headers, exc_info=None):
+        status.append(status_line)
+    
+    try:
+        result = app.wsgi_app(environ, start_response)
         try:
-            response = client.post('/api/events/1/join', 
-                                 data="invalid json", 
-                                 content_type='application/json')
-            print(f"Status Code: {response.status_code}")
-            print(f"Response: {json.dumps(response.get_json(), indent=2)}")
-        except Exception as e:
-            print(f"Note: Events endpoint may not be fully implemented yet: {e}")
-        
-        # Test health endpoint (should work)
-        print("\n4. Testing successful response (health check):")
-        response = client.get('/health')
-        print(f"Status Code: {response.status_code}")
-        print(f"Response: {json.dumps(response.get_json(), indent=2)}")
+            payload = b"".join(result)
+        finally:
+            if hasattr(result, 'close'):
+                result.close()
+        return int(status[0].split(' ', 1)[0]), json.loads(payload) if payload else None
+    except Exception as e:
+        return e
+
+
+@functools.cache
+def _default_app():
+    """Build the app on first use and share it across runs."""
+    return create_app()
+
+
+def test_error_handlers(app=None):
+    """
+    Test the centralized error handlers.
+    
+    Args:
+        app (Flask, optional): App to probe; defaults to one shared instance
+            so repeated runs don't rebuild it
+    
+    Returns:
+        bool: True if every probe returned its expected status and error code
+    """
+    app = app or _default_app()
+    
+    print("Testing centralized error handlers...")
+    print("=" * 50)
+    
+    # Dispatch every probe at once; map() still yields the results in probe order
+    with ThreadPoolExecutor(max_workers=len(PROBES)) as executor:
+        results = list(executor.map(lambda environ: _call_wsgi(app, environ), _ENVIRONS))
+    
+    passed = 0
+    for (label, *_, expected_status, expected_error), result in zip(PROBES, results):
+        print(f"\n{label}")
+        if isinstance(result, Exception):
+            print(f"Note: Endpoint may not be fully implemented yet: {result}")
+            continue
+        status_code, payload = result
+        print(f"Status Code: {status_code}")
+        print(f"Response: {_pretty_json(payload)}")
         
-        print("\n" + "=" * 50)
-        print("Error handler testing completed!")
+        error = payload.get('error') if isinstance(payload, dict) else None
+        if status_code == expected_status and error == expected_error:
+            passed += 1
+            print("✓ Matches expected response")
+        else:
+            print(f"✗ Expected {expected_status} with error {expected_error}")
+    
+    print("\n" + "=" * 50)
+    print(f"Error handler testing completed! {passed}/{len(PROBES)} probes passed")
+    return passed == len(PROBES)
 
 
 if __name__ == "__main__":
-    test_error_handlers()
\ No newline at end of file
+    sys.exit(0 if test_error_handlers() else 1)
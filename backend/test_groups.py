@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Test the GroupService tag index and its consistency after group creation.
+"""
+
+import os
+import sys
+
+# Add the current directory to Python path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from app.models.data_models import CreateGroupRequest
+from app.services.group_service import GroupService
+
+# Single tags, shared tags, combinations and a tag no group carries
+TAG_QUERIES = [
+    ["community"],
+    ["competition"],
+    ["creativity", "art"],
+    ["community", "service", "volunteer"],
+    ["STEM", "sports"],
+    ["no-such-tag"],
+]
+
+def _scan_by_tags(tags):
+    """Find groups carrying every tag by scanning all groups, for comparison with the index."""
+    return [group.id for group in GroupService.get_all_groups()
+            if all(tag in group.tags for tag in tags)]
+
+def _check_tag_queries():
+    """Compare indexed tag lookups with a full scan; return the first mismatch or None."""
+    for tags in TAG_QUERIES:
+        indexed = [group.id for group in GroupService.get_groups_by_tags(tags)]
+        if sorted(indexed, key=int) != sorted(_scan_by_tags(tags), key=int):
+            return f"{tags}: index returned {indexed}, scan found {_scan_by_tags(tags)}"
+    return None
+
+def test_groups():
+    """Test that tag lookups agree with a scan before and after creating a group."""
+    print("Testing group tag index...")
+    
+    try:
+        if GroupService.get_groups_by_tags([]):
+            print("✗ An empty tag list should match no groups")
+            return False
+        
+        mismatch = _check_tag_queries()
+        if mismatch:
+            print(f"✗ {mismatch}")
+            return False
+        print(f"✓ {len(TAG_QUERIES)} tag queries match a full scan")
+        
+        create_request = CreateGroupRequest(
+            name="Chess Club",
+            description="Weekly casual and rated games.",
+            category="academic",
+            meetingTime="Fridays 5 PM",
+            location="Library Room 2",
+            contact="chess@example.com"
+        )
+        result = GroupService.create_group(create_request, "user-1")
+        if not result.success:
+            print(f"✗ Group creation failed: {result.message}")
+            return False
+        
+        new_id = result.data["id"]
+        if GroupService.get_group_by_id(new_id) is None:
+            print(f"✗ New group {new_id} missing from the ID index")
+            return False
+        if new_id not in [group.id for group in GroupService.get_groups_by_category("academic")]:
+            print(f"✗ New group {new_id} missing from the category index")
+            return False
+        
+        mismatch = _check_tag_queries()
+        if mismatch:
+            print(f"✗ After creating a group: {mismatch}")
+            return False
+        print("✓ Indexes stay consistent after creating a group")
+        
+        print("✓ Group tag index is working correctly!")
+        return True
+    
+    except Exception as e:
+        print(f"✗ Group test failed: {str(e)}")
+        return False
+
+if __name__ == "__main__":
+    success = test_groups()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""
+Test keyset pagination of the post feed and its cursor and limit parsing.
+"""
+
+import os
+import sys
+from datetime import datetime
+
+# Add the current directory to Python path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from sqlalchemy import text
+
+from app import database
+from app.database import init_database, create_tables, upgrade_schema
+from app.models.auth_models import Post
+from app.services.post_service import _paginate
+from app.utils.helpers import (
+    DEFAULT_PAGE_LIMIT,
+    MAX_PAGE_LIMIT,
+    decode_cursor,
+    encode_cursor,
+    parse_pagination_args
+)
+
+# Every post in the test shares this timestamp, so only the id breaks ties
+SHARED_TIMESTAMP = datetime(2024, 1, 1, 12, 0, 0)
+
+def _walk_pages(db, limit):
+    """Follow next cursors from the first page to the last, collecting post IDs."""
+    seen = []
+    cursor = None
+    # More pages than posts means the cursor is not advancing
+    for _ in range(db.query(Post).count() + 1):
+        rows, cursor = _paginate(db.query(Post.id, Post.created_at), Post, limit, cursor)
+        seen.extend(row.id for row in rows)
+        if cursor is None:
+            return seen
+    raise AssertionError(f"pagination did not finish; pages so far returned {seen}")
+
+def test_cursor_parsing():
+    """Test cursor round-trips, rejection of bad cursors and limit clamping."""
+    print("Testing cursor and limit parsing...")
+    
+    cursor = (datetime(2024, 1, 1, 12, 0, 0, 123456), 'post-1|with-pipe')
+    token = encode_cursor(cursor)
+    if decode_cursor(token) != cursor:
+        print(f"✗ Cursor did not round-trip: {decode_cursor(token)} != {cursor}")
+        return False
+    if encode_cursor(None) is not None:
+        print("✗ encode_cursor(None) should be None")
+        return False
+    print("✓ Cursor round-trips")
+    
+    # Not base64, not UTF-8, no separator, and an unparsable timestamp
+    for bad in ('%%%', 'not-a-cursor', 'bm8tc2VwYXJhdG9y', 'eWVzdGVyZGF5fHBvc3QtMQ=='):
+        try:
+            decode_cursor(bad)
+        except ValueError:
+            continue
+        print(f"✗ Malformed cursor accepted: {bad!r}")
+        return False
+    print("✓ Malformed cursors rejected")
+    
+    cases = [
+        ({}, DEFAULT_PAGE_LIMIT),
+        ({'limit': '5'}, 5),
+        ({'limit': str(MAX_PAGE_LIMIT + 1)}, MAX_PAGE_LIMIT),
+        ({'limit': '100000'}, MAX_PAGE_LIMIT),
+    ]
+    for args, expected in cases:
+        limit, parsed_cursor = parse_pagination_args(args)
+        if limit != expected or parsed_cursor is not None:
+            print(f"✗ {args}: expected limit {expected}, got {limit} (cursor {parsed_cursor})")
+            return False
+    limit, parsed_cursor = parse_pagination_args({'limit': '3', 'cursor': token})
+    if (limit, parsed_cursor) != (3, cursor):
+        print(f"✗ Cursor argument not decoded: {(limit, parsed_cursor)}")
+        return False
+    print("✓ Limits default and clamp correctly")
+    
+    for args in ({'limit': '0'}, {'limit': '-1'}, {'limit': 'ten'}, {'cursor': 'garbage'}):
+        try:
+            parse_pagination_args(args)
+        except ValueError:
+            continue
+        print(f"✗ Invalid pagination arguments accepted: {args}")
+        return False
+    print("✓ Invalid pagination arguments rejected")
+    
+    return True
+
+def test_pagination():
+    """Test that paging through posts with equal timestamps returns each post once."""
+    print("Testing keyset pagination...")
+    
+    try:
+        # Private in-memory database so the test never touches real data
+        init_database('sqlite://')
+        create_tables()
+        
+        with database.engine.begin() as connection:
+            connection.execute(text(
+                "INSERT INTO users (id, email, password_hash, first_name, last_name, full_name, "
+                "major, year_of_study, user_role, is_active, is_verified, created_at, updated_at) "
+                "VALUES ('u1', 'u1@example.com', 'x', 'Test', 'User', 'Test User', 'CS', '1', "
+                "'student', 1, 1, '2024-01-01 12:00:00', '2024-01-01 12:00:00')"
+            ))
+            # Rows in the whole-second format the old func.now() default produced
+            for post_id in ('legacy-a', 'legacy-b'):
+                connection.execute(text(
+                    "INSERT INTO posts (id, title, description, category, author_id, like_count, "
+                    "is_active, created_at, updated_at) VALUES "
+                    f"('{post_id}', 't', 'd', 'general', 'u1', 0, 1, "
+                    "'2024-01-01 12:00:00', '2024-01-01 12:00:00')"
+                ))
+        upgrade_schema()
+        print("✓ Legacy timestamps normalized")
+        
+        db = database.get_db_session()
+        try:
+            for post_id in ('a', 'b', 'c'):
+                db.add(Post(id=post_id, title='t', description='d', category='general',
+                            author_id='u1', created_at=SHARED_TIMESTAMP))
+            db.commit()
+            
+            expected = ['legacy-b', 'legacy-a', 'c', 'b', 'a']
+            for limit in (1, 2, 10):
+                seen = _walk_pages(db, limit)
+                if len(seen) != len(set(seen)):
+                    print(f"✗ limit={limit}: duplicate posts across pages: {seen}")
+                    return False
+                if sorted(seen) != sorted(expected):
+                    print(f"✗ limit={limit}: expected {sorted(expected)}, got {seen}")
+                    return False
+                print(f"✓ limit={limit}: {len(seen)} posts, no duplicates")
+        finally:
+            db.close()
+        
+        print("✓ Pagination is working correctly!")
+        return True
+    
+    except Exception as e:
+        print(f"✗ Pagination test failed: {str(e)}")
+        return False
+
+if __name__ == "__main__":
+    success = test_cursor_parsing() and test_pagination()
+    sys.exit(0 if success else 1)
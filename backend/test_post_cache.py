@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Test that cached post reads are invalidated by likes and comments.
+"""
+
+import os
+import sys
+
+# Add the current directory to Python path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from app import database
+from app.database import init_database, create_tables
+from app.models.auth_models import User, Post
+from app.services.post_service import PostService
+from app.utils.cache import TTLCache, cached
+
+def test_stale_load_dropped():
+    """Test that a load overlapping an invalidation is not stored."""
+    print("Testing cache generation check...")
+    
+    cache = TTLCache(ttl_seconds=60)
+    
+    @cached(cache, "posts:all")
+    def load_during_write(page):
+        # A write commits and invalidates while this read is still loading
+        cache.delete_prefix("posts:")
+        return ["stale"]
+    
+    load_during_write(1)
+    if cache.get("posts:all:1") is not None:
+        print("✗ Result loaded across an invalidation was cached")
+        return False
+    
+    @cached(cache, "posts:all")
+    def load(page):
+        return ["fresh"]
+    
+    load(1)
+    if cache.get("posts:all:1") != ["fresh"]:
+        print("✗ Result loaded without an invalidation was not cached")
+        return False
+    
+    print("✓ Only loads that finish before the next invalidation are cached")
+    return True
+
+def test_post_cache():
+    """Test that likes and comments are visible on the next cached read."""
+    print("Testing post cache invalidation...")
+    
+    try:
+        # Private in-memory database so the test never touches real data
+        init_database('sqlite://')
+        create_tables()
+        
+        db = database.get_db_session()
+        try:
+            db.add(User(id='u1', email='u1@example.com', password_hash='x', first_name='Test',
+                        last_name='User', full_name='Test User', major='CS', year_of_study='1'))
+            db.add(Post(id='p1', title='t', description='d', category='general', author_id='u1'))
+            db.commit()
+        finally:
+            db.close()
+        
+        # Prime the feed, single-post and comment caches
+        posts, _ = PostService.get_all_posts(10, None)
+        post = PostService.get_post_by_id('p1')
+        comments, _ = PostService.get_post_comments('p1')
+        if posts[0]['likes'] != 0 or post['likes'] != 0 or comments:
+            print(f"✗ Unexpected starting state: {posts}, {post}, {comments}")
+            return False
+        
+        result = PostService.like_post('p1', 'u1')
+        if not result.success:
+            print(f"✗ Like failed: {result.message}")
+            return False
+        posts, _ = PostService.get_all_posts(10, None)
+        post = PostService.get_post_by_id('p1')
+        if posts[0]['likes'] != 1 or post['likes'] != 1:
+            print(f"✗ Like not visible after invalidation: feed {posts[0]['likes']}, post {post['likes']}")
+            return False
+        print("✓ Like visible on the next read")
+        
+        result = PostService.add_comment('p1', 'u1', 'First!')
+        if not result.success:
+            print(f"✗ Comment failed: {result.message}")
+            return False
+        comments, _ = PostService.get_post_comments('p1')
+        posts, _ = PostService.get_all_posts(10, None)
+        if len(comments) != 1 or posts[0]['comments'] != 1:
+            print(f"✗ Comment not visible after invalidation: {len(comments)} comments, "
+                  f"feed count {posts[0]['comments']}")
+            return False
+        print("✓ Comment visible on the next read")
+        
+        print("✓ Post cache invalidation is working correctly!")
+        return True
+    
+    except Exception as e:
+        print(f"✗ Post cache test failed: {str(e)}")
+        return False
+
+if __name__ == "__main__":
+    success = test_stale_load_dropped() and test_post_cache()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""
+Test that pipelined SMTP sends refuse envelope addresses carrying CR/LF.
+"""
+
+import os
+import sys
+
+# Add the current directory to Python path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from smtp_delivery import send_pipelined
+
+
+class _RecordingSMTP:
+    """Stand-in session that advertises PIPELINING and records every write."""
+
+    def __init__(self):
+        self.sent = []
+
+    def ehlo_or_helo_if_needed(self):
+        pass
+
+    def has_extn(self, name):
+        return name == 'pipelining'
+
+    def send(self, data):
+        self.sent.append(data)
+
+
+def test_send_pipelined():
+    """Test that a CRLF-bearing recipient is refused before anything is written."""
+    print("Testing pipelined send address checks...")
+    
+    conn = _RecordingSMTP()
+    try:
+        send_pipelined(conn, 'sender@example.com',
+                       'victim@example.com>\r\nRCPT TO:<relay@example.com', b"Subject: x\r\n\r\nx\r\n")
+    except ValueError:
+        if conn.sent:
+            print(f"✗ Data was written before the address was refused: {conn.sent}")
+            return False
+        print("✓ CRLF-bearing recipient refused")
+        return True
+    
+    print("✗ CRLF-bearing recipient was accepted")
+    return False
+
+if __name__ == "__main__":
+    success = test_send_pipelined()
+    sys.exit(0 if success else 1)